@@ -4,4 +4,39 @@ human-like-ai パッケージ。
 このパッケージは、人間らしいAIエージェントを提供します。
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.human_like_ai.core.agent import Agent, AgentFactory
+
 __version__ = '0.1.0'
+
+__all__ = ['Agent', 'AgentFactory']
+
+# 公開APIは初回アクセス時に読み込む(PEP 562)
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    'Agent': 'src.human_like_ai.core.agent',
+    'AgentFactory': 'src.human_like_ai.core.agent',
+}
+
+
+def __getattr__(name: str) -> type:
+    """公開APIを遅延読み込みします。
+
+    Args:
+        name: 属性名
+
+    Returns:
+        type: 読み込まれたクラス
+
+    Raises:
+        AttributeError: 属性が存在しない場合
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    import importlib
+
+    value: type = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
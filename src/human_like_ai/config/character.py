@@ -4,6 +4,7 @@
 このモジュールは、キャラクターシート(YAML)の読み込みと管理を行います。
 """
 
+import pickle
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,45 @@ import yaml
 
 from src.human_like_ai.config.settings import Settings
 
+# libyaml が利用可能な場合は C 実装のローダー/ダンパーを使用する
+# (PyYAML を libyaml 付きでインストールしておくことを推奨)
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# キャラクターシートの横に置くキャッシュファイルの拡張子
+# (日付などの型を保つため、データは JSON ではなく pickle で保存する)
+DATA_CACHE_SUFFIX = '.pickle'
+TEXT_CACHE_SUFFIX = '.txt'
+
+
+def _get_cache_path(path: Path, suffix: str) -> Path:
+    """キャラクターシートに対応するキャッシュファイルのパスを取得します。
+
+    Args:
+        path: キャラクターシートのファイルパス
+        suffix: キャッシュファイルの拡張子
+
+    Returns:
+        Path: キャッシュファイルのパス(例: character_sheet.yaml.pickle)
+    """
+    return path.with_name(path.name + suffix)
+
+
+def _is_cache_fresh(cache_path: Path, source_mtime: float) -> bool:
+    """キャッシュファイルが元ファイルより新しいかどうかを判定します。
+
+    Args:
+        cache_path: キャッシュファイルのパス
+        source_mtime: 元ファイルの更新時刻
+
+    Returns:
+        bool: キャッシュが有効な場合はTrue
+    """
+    try:
+        return cache_path.stat().st_mtime >= source_mtime
+    except OSError:
+        return False
+
 
 class CharacterLoader:
     """キャラクター設定ローダークラス。
@@ -20,6 +60,9 @@ class CharacterLoader:
     Attributes:
         settings: アプリケーション設定
         _character_data: 読み込まれたキャラクターデータ
+        _character_text: キャラクターデータのYAMLテキスト表現(キャッシュ)
+        _character_path: 最後に読み込んだキャラクターシートのパス
+        _loaded: キャラクターシートを読み込み済みかどうか
     """
 
     def __init__(self, settings: Settings | None = None) -> None:
@@ -32,6 +75,9 @@ class CharacterLoader:
 
         self.settings = settings or get_settings()
         self._character_data: dict[str, Any] = {}
+        self._character_text: str | None = None
+        self._character_path: Path | None = None
+        self._loaded = False
 
     def load(self, file_path: Path | None = None) -> dict[str, Any]:
         """キャラクター設定を読み込みます。
@@ -47,12 +93,38 @@ class CharacterLoader:
             FileNotFoundError: ファイルが見つからない場合
             yaml.YAMLError: YAMLの解析エラーが発生した場合
         """
-        path = file_path or self.settings.character_sheet_path
+        path = Path(file_path or self.settings.character_sheet_path)
+
+        try:
+            source_mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f'キャラクターシートが見つかりません: {path}'
+            ) from None
+
+        self._character_path = path
+        self._character_text = None
+
+        # キャッシュが有効な場合はYAMLを解析せずに読み込む
+        data_cache = _get_cache_path(path, DATA_CACHE_SUFFIX)
+        if _is_cache_fresh(data_cache, source_mtime):
+            try:
+                self._character_data = pickle.loads(data_cache.read_bytes())
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                text_cache = _get_cache_path(path, TEXT_CACHE_SUFFIX)
+                if _is_cache_fresh(text_cache, source_mtime):
+                    try:
+                        self._character_text = text_cache.read_text(encoding='utf-8')
+                    except OSError:
+                        pass
+                self._loaded = True
+                return self._character_data
 
         try:
             with open(path, encoding='utf-8') as f:
-                self._character_data = yaml.safe_load(f)
-            return self._character_data
+                self._character_data = yaml.load(f, Loader=Loader)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f'キャラクターシートが見つかりません: {path}'
@@ -60,15 +132,36 @@ class CharacterLoader:
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f'キャラクターシートの解析エラー: {e}') from e
 
+        # キャッシュの書き込みに失敗しても読み込み自体は成功とする
+        try:
+            data_cache.write_bytes(pickle.dumps(self._character_data))
+        except OSError:
+            pass
+        self._loaded = True
+        return self._character_data
+
     def get_character_text(self) -> str:
         """キャラクターデータをテキスト形式で取得します。
 
+        一度生成したテキストはキャッシュされ、load() が呼ばれるまで再利用されます。
+        生成したテキストはキャラクターシートの横にも保存され、次回起動時に再利用されます。
+
         Returns:
             str: キャラクターデータのYAMLテキスト表現
         """
-        if not self._character_data:
+        if not self._loaded:
             self.load()
-        return yaml.dump(self._character_data, allow_unicode=True)
+        if self._character_text is None:
+            self._character_text = yaml.dump(
+                self._character_data, allow_unicode=True, Dumper=Dumper
+            )
+            if self._character_path is not None:
+                text_cache = _get_cache_path(self._character_path, TEXT_CACHE_SUFFIX)
+                try:
+                    text_cache.write_text(self._character_text, encoding='utf-8')
+                except OSError:
+                    pass
+        return self._character_text
 
     def get_character_data(self) -> dict[str, Any]:
         """キャラクターデータを取得します。
@@ -76,6 +169,6 @@ class CharacterLoader:
         Returns:
             Dict[str, Any]: キャラクターデータ
         """
-        if not self._character_data:
+        if not self._loaded:
             self.load()
         return self._character_data
@@ -5,15 +5,21 @@
 環境変数からの読み込みや、デフォルト値の設定を行います。
 """
 
+import functools
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
-from pydantic import BaseModel
+# .env ファイルを読み込み済みかどうか
+_dotenv_loaded: bool = False
 
 
-class Settings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Settings:
     """アプリケーション設定クラス。
 
     環境変数から設定を読み込み、デフォルト値を提供します。
+    設定は不変のため、値を変更する場合は dataclasses.replace() でコピーを作成します。
 
     Attributes:
         openai_api_key: OpenAI APIキー
@@ -32,22 +38,33 @@ class Settings(BaseModel):
     timezone: str = 'Asia/Tokyo'
 
 
+def _load_dotenv_once() -> None:
+    """.env ファイルをプロセス内で一度だけ読み込みます。"""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """設定インスタンスを取得します。
 
     環境変数から設定を読み込みます。
     OPENAI_API_KEYが設定されていない場合はダミー値を使用します。
+    生成した設定はキャッシュされ、以降の呼び出しでは同じインスタンスを返します。
+    環境変数を再読み込みする場合は get_settings.cache_clear() を呼び出してください。
 
     Returns:
         Settings: 設定インスタンス
     """
     try:
         # 環境変数から読み込み
-        import os
-
-        from dotenv import load_dotenv
-
-        load_dotenv()
+        _load_dotenv_once()
 
         # 必須の環境変数
         openai_api_key = os.getenv('OPENAI_API_KEY', 'dummy-api-key')
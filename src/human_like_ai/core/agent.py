@@ -4,16 +4,69 @@
 このモジュールは、人間らしいAIエージェントの基本クラスとファクトリーを提供します。
 """
 
-from typing import Any
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from src.human_like_ai.config.settings import Settings, get_settings
-from src.human_like_ai.core.conversation import ConversationManager, PromptManager
-from src.human_like_ai.core.memory import MemoryManager
-from src.human_like_ai.core.rag import CharacterRAGService
-from src.human_like_ai.emotion.extractor import EmotionEventExtractor
-from src.human_like_ai.emotion.manager import EmotionManager
-from src.human_like_ai.utils.llm import LLMService
-from src.human_like_ai.utils.logging import get_default_logger
+
+if TYPE_CHECKING:
+    from src.human_like_ai.core.conversation import PromptManager
+    from src.human_like_ai.core.memory import MemoryManager
+    from src.human_like_ai.core.rag import CharacterRAGService
+    from src.human_like_ai.emotion.extractor import EmotionEventExtractor
+    from src.human_like_ai.emotion.manager import EmotionManager
+    from src.human_like_ai.utils.llm import LLMService
+
+# キャラクターシートのパスごとの (更新時刻, 初期化済みRAGサービス)
+_rag_service_cache: dict[str, tuple[float, 'CharacterRAGService']] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_emotion_extractor(model_name: str) -> 'EmotionEventExtractor':
+    """モデル名ごとに共有する感情抽出器を取得します。
+
+    Args:
+        model_name: 使用するLLMモデル名
+
+    Returns:
+        EmotionEventExtractor: 感情抽出器
+    """
+    from src.human_like_ai.emotion.extractor import EmotionEventExtractor
+
+    return EmotionEventExtractor(model_name)
+
+
+def _get_character_rag_service(settings: Settings) -> 'CharacterRAGService':
+    """初期化済みのキャラクターRAGサービスを取得します。
+
+    キャラクターシートが更新されていない場合は、作成済みのサービス(とベクトルストア)を
+    再利用し、埋め込みの再計算を省略します。
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        CharacterRAGService: 初期化済みのキャラクターRAGサービス
+    """
+    from src.human_like_ai.core.rag import CharacterRAGService
+
+    path = Path(settings.character_sheet_path)
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    key = str(path.resolve())
+    cached = _rag_service_cache.get(key)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    rag_service = CharacterRAGService(settings)
+    rag_service.initialize_from_character_sheet()
+    if mtime is not None:
+        _rag_service_cache[key] = (mtime, rag_service)
+    return rag_service
 
 
 class Agent:
@@ -35,12 +88,12 @@ class Agent:
 
     def __init__(
         self,
-        llm_service: LLMService,
-        memory_manager: MemoryManager,
-        emotion_manager: EmotionManager,
-        emotion_extractor: EmotionEventExtractor,
-        rag_service: CharacterRAGService,
-        prompt_manager: PromptManager,
+        llm_service: 'LLMService',
+        memory_manager: 'MemoryManager',
+        emotion_manager: 'EmotionManager',
+        emotion_extractor: 'EmotionEventExtractor',
+        rag_service: 'CharacterRAGService',
+        prompt_manager: 'PromptManager',
         settings: Settings | None = None,
     ) -> None:
         """初期化メソッド。
@@ -54,6 +107,9 @@ class Agent:
             prompt_manager: プロンプト管理
             settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
         """
+        from src.human_like_ai.core.conversation import ConversationManager
+        from src.human_like_ai.utils.logging import get_default_logger
+
         self.settings = settings or get_settings()
         self.llm_service = llm_service
         self.memory_manager = memory_manager
@@ -115,7 +171,7 @@ class Agent:
             'global_mood': self.emotion_manager.get_global_mood(),
             'memories': self.memory_manager.memories,
             'attentions': self.memory_manager.attentions,
-            'chat_history': self.memory_manager.chat_history,
+            'chat_history': self.memory_manager.get_chat_history(),
         }
 
 
@@ -135,6 +191,13 @@ class AgentFactory:
         Returns:
             Agent: 作成されたエージェント
         """
+        # 起動時間短縮のため、各コンポーネントはエージェント作成時に読み込む
+        from src.human_like_ai.core.conversation import PromptManager
+        from src.human_like_ai.core.memory import MemoryManager
+        from src.human_like_ai.emotion.manager import EmotionManager
+        from src.human_like_ai.utils.llm import LLMService
+        from src.human_like_ai.utils.logging import get_default_logger
+
         settings = settings or get_settings()
         logger = get_default_logger(settings)
         logger.info('エージェントの作成を開始します。')
@@ -143,13 +206,12 @@ class AgentFactory:
         llm_service = LLMService(settings)
         memory_manager = MemoryManager(settings)
         emotion_manager = EmotionManager()
-        emotion_extractor = EmotionEventExtractor(settings.model_name)
-        rag_service = CharacterRAGService(settings)
+        emotion_extractor = _get_emotion_extractor(settings.model_name)
         prompt_manager = PromptManager(settings)
 
-        # RAGサービスの初期化
+        # RAGサービスの初期化(キャラクターシートが未更新なら既存のものを再利用)
         logger.info('キャラクターRAGサービスを初期化します。')
-        rag_service.initialize_from_character_sheet()
+        rag_service = _get_character_rag_service(settings)
 
         # エージェントの作成
         agent = Agent(
@@ -4,6 +4,7 @@
 このモジュールは、プロンプト管理と会話フローを制御するためのクラスを提供します。
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from langchain_core.messages import BaseMessage
@@ -23,34 +24,8 @@ if TYPE_CHECKING:
     from src.human_like_ai.utils.llm import LLMService
 
 
-class PromptManager:
-    """プロンプト管理クラス。
-
-    システムプロンプトとプロンプトテンプレートを管理します。
-
-    Attributes:
-        settings: アプリケーション設定
-        system_prompt_template: システムプロンプトテンプレート
-        prompt_template: 全体のプロンプトテンプレート
-    """
-
-    def __init__(self, settings: Settings | None = None) -> None:
-        """初期化メソッド。
-
-        Args:
-            settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
-        """
-        self.settings = settings or get_settings()
-        self.system_prompt_template = self._create_system_prompt_template()
-        self.prompt_template = self._create_prompt_template()
-
-    def _create_system_prompt_template(self) -> SystemMessagePromptTemplate:
-        """システムプロンプトテンプレートを作成します。
-
-        Returns:
-            SystemMessagePromptTemplate: システムプロンプトテンプレート
-        """
-        system_template = """
+# システムプロンプトのテンプレート文字列
+_SYSTEM_TEMPLATE = """
 あなたは人間です。AIとしてではなく、人間としてユーザーと対話を行ってください。
 もし、キャラクター設定上未定義のことを聞かれた場合は、既存の設定と不整合がないように新たな設定を考えて発話して構いません。
 
@@ -87,21 +62,38 @@ class PromptManager:
 ## 現在の日時
 {datetime}
 """
-        return SystemMessagePromptTemplate.from_template(system_template)
 
-    def _create_prompt_template(self) -> ChatPromptTemplate:
-        """プロンプトテンプレートを作成します。
+# テンプレートの解析はモジュール読み込み時に一度だけ行い、全インスタンスで共有する
+_SYSTEM_PROMPT_TEMPLATE = SystemMessagePromptTemplate.from_template(_SYSTEM_TEMPLATE)
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        _SYSTEM_PROMPT_TEMPLATE,
+        MessagesPlaceholder(variable_name='chat_history', optional=True),
+        ('human', '{input}'),
+    ]
+)
 
-        Returns:
-            ChatPromptTemplate: プロンプトテンプレート
+
+class PromptManager:
+    """プロンプト管理クラス。
+
+    システムプロンプトとプロンプトテンプレートを管理します。
+
+    Attributes:
+        settings: アプリケーション設定
+        system_prompt_template: システムプロンプトテンプレート
+        prompt_template: 全体のプロンプトテンプレート
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        """初期化メソッド。
+
+        Args:
+            settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
         """
-        return ChatPromptTemplate.from_messages(
-            [
-                self.system_prompt_template,
-                MessagesPlaceholder(variable_name='chat_history', optional=True),
-                ('human', '{input}'),
-            ]
-        )
+        self.settings = settings or get_settings()
+        self.system_prompt_template = _SYSTEM_PROMPT_TEMPLATE
+        self.prompt_template = _PROMPT_TEMPLATE
 
     def get_prompt_template(self) -> ChatPromptTemplate:
         """プロンプトテンプレートを取得します。
@@ -111,16 +103,16 @@ class PromptManager:
         """
         return self.prompt_template
 
-    def format_prompt(self, **kwargs: dict[str, Any]) -> list[BaseMessage]:
+    def format_prompt(self, variables: dict[str, Any]) -> list[BaseMessage]:
         """プロンプトを整形します。
 
         Args:
-            **kwargs: プロンプト変数
+            variables: プロンプト変数
 
         Returns:
             list[BaseMessage]: 整形されたプロンプトメッセージのリスト
         """
-        return self.prompt_template.format_prompt(**kwargs).to_messages()
+        return self.prompt_template.format_prompt(**variables).to_messages()
 
 
 class ConversationManager:
@@ -135,6 +127,7 @@ class ConversationManager:
         emotion_manager: 感情管理
         rag_service: RAGサービス
         llm_service: LLMサービス
+        _executor: RAG検索を感情抽出と並行して実行するためのスレッドプール
     """
 
     def __init__(
@@ -164,6 +157,9 @@ class ConversationManager:
         self.emotion_extractor = emotion_extractor
         self.rag_service = rag_service
         self.llm_service = llm_service
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='conversation-rag'
+        )
 
     def process_input(self, user_input: str) -> str:
         """ユーザー入力を処理し、応答を生成します。
@@ -177,28 +173,26 @@ class ConversationManager:
         # 1. ユーザー入力を記憶に追加
         self.memory_manager.add_user_message(user_input)
 
-        # 2. RAG検索
-        rag_context = self.rag_service.retrieve_character_info(user_input)
+        # 2. RAG検索(互いに独立したネットワーク呼び出しのため、感情抽出と並行して実行)
+        rag_future = self._executor.submit(
+            self.rag_service.retrieve_character_info, user_input
+        )
 
         # 3. 感情イベントの抽出と感情状態の更新
         emotion_events = self.emotion_extractor.extract_emotion_events(user_input)
+        rag_context = rag_future.result()
         self.emotion_manager.update_from_llm(emotion_events)
         emotions_output = self.emotion_manager.generate_output()
 
         # 4. プロンプトコンテキストの準備
         context = self.memory_manager.get_prompt_context()
-        context.update(
-            {
-                'input': user_input,
-                'rag_context': rag_context,
-                'emotions': emotions_output,
-                'prompt_template': self.prompt_manager.get_prompt_template(),
-            }
-        )
+        context['input'] = user_input
+        context['rag_context'] = rag_context
+        context['emotions'] = emotions_output
 
         # 5. LLMによる応答生成
-        response_obj = self.llm_service.generate(context)
-        response = str(response_obj)
+        messages = self.prompt_manager.format_prompt(context)
+        response = self.llm_service.generate_with_messages(messages)
 
         # 6. 応答を記憶に追加
         self.memory_manager.add_ai_message(response)
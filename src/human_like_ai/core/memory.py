@@ -4,6 +4,7 @@
 このモジュールは、会話履歴、長期記憶、関心事などの記憶を管理するためのクラスを提供します。
 """
 
+from collections import deque
 from datetime import datetime
 from typing import Any
 
@@ -20,10 +21,14 @@ class MemoryManager:
 
     Attributes:
         settings: アプリケーション設定
-        chat_history: 会話履歴
+        chat_history: 会話履歴(最大長を超えた古いメッセージは自動的に破棄される)
         memories: 長期記憶のリスト
         attentions: 関心事のリスト
-        max_history_length: 保持する会話履歴の最大長
+        max_history_length: 保持する会話履歴の最大長(読み取り専用)
+        _memories_set: 長期記憶の所属判定用の集合
+        _attentions_set: 関心事の所属判定用の集合
+        _memories_text_cache: 長期記憶のテキスト表現(キャッシュ)
+        _attentions_text_cache: 関心事のテキスト表現(キャッシュ)
     """
 
     def __init__(
@@ -38,10 +43,21 @@ class MemoryManager:
             max_history_length: 保持する会話履歴の最大長
         """
         self.settings = settings or get_settings()
-        self.chat_history: list[BaseMessage] = []
+        self.chat_history: deque[BaseMessage] = deque(maxlen=max_history_length)
         self.memories: list[str] = []
         self.attentions: list[str] = []
-        self.max_history_length = max_history_length
+        self._memories_set: set[str] = set()
+        self._attentions_set: set[str] = set()
+        self._memories_text_cache: str | None = None
+        self._attentions_text_cache: str | None = None
+
+    @property
+    def max_history_length(self) -> int | None:
+        """保持する会話履歴の最大長。
+
+        会話履歴の deque の maxlen を返します。変更することはできません。
+        """
+        return self.chat_history.maxlen
 
     def add_user_message(self, content: str) -> None:
         """ユーザーメッセージを会話履歴に追加します。
@@ -50,7 +66,6 @@ class MemoryManager:
             content: メッセージ内容
         """
         self.chat_history.append(HumanMessage(content=content))
-        self._trim_history()
 
     def add_ai_message(self, content: str) -> None:
         """AIメッセージを会話履歴に追加します。
@@ -59,7 +74,6 @@ class MemoryManager:
             content: メッセージ内容
         """
         self.chat_history.append(AIMessage(content=content))
-        self._trim_history()
 
     def add_system_message(self, content: str) -> None:
         """システムメッセージを会話履歴に追加します。
@@ -68,16 +82,10 @@ class MemoryManager:
             content: メッセージ内容
         """
         self.chat_history.append(SystemMessage(content=content))
-        self._trim_history()
-
-    def _trim_history(self) -> None:
-        """会話履歴を最大長に制限します。"""
-        if len(self.chat_history) > self.max_history_length:
-            self.chat_history = self.chat_history[-self.max_history_length :]
 
     def clear_history(self) -> None:
         """会話履歴をクリアします。"""
-        self.chat_history = []
+        self.chat_history.clear()
 
     def add_memory(self, memory: str) -> None:
         """長期記憶を追加します。
@@ -85,8 +93,10 @@ class MemoryManager:
         Args:
             memory: 記憶内容
         """
-        if memory not in self.memories:
+        if memory not in self._memories_set:
+            self._memories_set.add(memory)
             self.memories.append(memory)
+            self._memories_text_cache = None
 
     def remove_memory(self, memory: str) -> None:
         """長期記憶を削除します。
@@ -94,8 +104,10 @@ class MemoryManager:
         Args:
             memory: 削除する記憶内容
         """
-        if memory in self.memories:
+        if memory in self._memories_set:
+            self._memories_set.discard(memory)
             self.memories.remove(memory)
+            self._memories_text_cache = None
 
     def add_attention(self, attention: str) -> None:
         """関心事を追加します。
@@ -103,8 +115,10 @@ class MemoryManager:
         Args:
             attention: 関心事内容
         """
-        if attention not in self.attentions:
+        if attention not in self._attentions_set:
+            self._attentions_set.add(attention)
             self.attentions.append(attention)
+            self._attentions_text_cache = None
 
     def remove_attention(self, attention: str) -> None:
         """関心事を削除します。
@@ -112,8 +126,10 @@ class MemoryManager:
         Args:
             attention: 削除する関心事内容
         """
-        if attention in self.attentions:
+        if attention in self._attentions_set:
+            self._attentions_set.discard(attention)
             self.attentions.remove(attention)
+            self._attentions_text_cache = None
 
     def get_chat_history(self) -> list[BaseMessage]:
         """会話履歴を取得します。
@@ -121,7 +137,7 @@ class MemoryManager:
         Returns:
             list[BaseMessage]: 会話履歴のリスト
         """
-        return self.chat_history
+        return list(self.chat_history)
 
     def get_memories_text(self) -> str:
         """長期記憶をテキスト形式で取得します。
@@ -129,7 +145,11 @@ class MemoryManager:
         Returns:
             str: 長期記憶のテキスト表現
         """
-        return '\n'.join(self.memories) if self.memories else 'なし'
+        if self._memories_text_cache is None:
+            self._memories_text_cache = (
+                '\n'.join(self.memories) if self.memories else 'なし'
+            )
+        return self._memories_text_cache
 
     def get_attentions_text(self) -> str:
         """関心事をテキスト形式で取得します。
@@ -137,7 +157,11 @@ class MemoryManager:
         Returns:
             str: 関心事のテキスト表現
         """
-        return '\n'.join(self.attentions) if self.attentions else 'なし'
+        if self._attentions_text_cache is None:
+            self._attentions_text_cache = (
+                '\n'.join(self.attentions) if self.attentions else 'なし'
+            )
+        return self._attentions_text_cache
 
     def get_current_datetime(self) -> str:
         """現在の日時を取得します。
@@ -145,7 +169,12 @@ class MemoryManager:
         Returns:
             str: 現在の日時の文字列表現
         """
-        return datetime.now(DEFAULT_TIMEZONE).strftime('%Y/%m/%d %H:%M:%S')
+        # strftime を経由せず、ロケールに依存しない形式で整形する
+        now = datetime.now(DEFAULT_TIMEZONE)
+        return (
+            f'{now.year:04d}/{now.month:02d}/{now.day:02d} '
+            f'{now.hour:02d}:{now.minute:02d}:{now.second:02d}'
+        )
 
     def get_prompt_context(self) -> dict[str, Any]:
         """プロンプト用のコンテキストを取得します。
@@ -153,8 +182,9 @@ class MemoryManager:
         Returns:
             Dict[str, Any]: プロンプト用のコンテキスト
         """
+        # MessagesPlaceholder は list のみを受け付けるため変換して渡す
         return {
-            'chat_history': self.chat_history,
+            'chat_history': list(self.chat_history),
             'memories': self.get_memories_text(),
             'attentions': self.get_attentions_text(),
             'datetime': self.get_current_datetime(),
@@ -5,15 +5,46 @@ RAG(Retrieval-Augmented Generation)モジュール。
 RAGシステムを提供します。
 """
 
+import functools
+import hashlib
+import pickle
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
-
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from src.human_like_ai.config.settings import Settings, get_settings
 
+if TYPE_CHECKING:
+    from langchain.text_splitter import CharacterTextSplitter
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+
+
+# キャラクターシートの横に保存する FAISS インデックスのディレクトリ拡張子
+INDEX_CACHE_SUFFIX = '.faiss'
+# インデックスの元になったテキストのハッシュを保存するファイル名
+INDEX_HASH_FILENAME = 'hash.txt'
+
+
+@functools.lru_cache(maxsize=1)
+def _get_text_splitter() -> 'CharacterTextSplitter':
+    """共有のテキスト分割器を取得します。
+
+    分割器は設定が固定で状態を持たないため、全てのサービスで同じインスタンスを使用します。
+
+    Returns:
+        CharacterTextSplitter: テキスト分割器
+    """
+    from langchain.text_splitter import CharacterTextSplitter
+
+    return CharacterTextSplitter(
+        separator='\n\n',  # 段落ごとに分割
+        chunk_size=500,  # おおよそ500文字
+        chunk_overlap=50,  # オーバーラップをもたせる
+    )
+
 
 class RAGService(ABC):
     """RAGサービスの抽象基底クラス。
@@ -62,13 +93,17 @@ class FAISSRAGService(RAGService):
         Args:
             settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
         """
+        # 起動時間短縮のため、重い依存はインスタンス生成時に読み込む
+        from langchain_openai import OpenAIEmbeddings
+
         self.settings = settings or get_settings()
-        self.text_splitter = CharacterTextSplitter(
-            separator='\n\n',  # 段落ごとに分割
-            chunk_size=500,  # おおよそ500文字
-            chunk_overlap=50,  # オーバーラップをもたせる
+        self.text_splitter = _get_text_splitter()
+        # 1リクエストあたりの入力数を API 上限まで増やし、往復回数を減らす
+        self.embeddings = OpenAIEmbeddings(
+            chunk_size=2048,
+            max_retries=2,
+            timeout=30,
         )
-        self.embeddings = OpenAIEmbeddings()
         self.vector_store: FAISS | None = None
 
     def initialize(self, documents: list[str]) -> None:
@@ -77,10 +112,12 @@ class FAISSRAGService(RAGService):
         Args:
             documents: 初期化に使用するドキュメントのリスト
         """
+        from langchain_community.vectorstores import FAISS
+
         # ドキュメントをチャンクに分割
-        chunks = []
-        for doc in documents:
-            chunks.extend(self.text_splitter.split_text(doc))
+        chunks = [
+            chunk for doc in documents for chunk in self.text_splitter.split_text(doc)
+        ]
 
         # ベクトルストアを作成
         self.vector_store = FAISS.from_texts(chunks, self.embeddings)
@@ -95,6 +132,26 @@ class FAISSRAGService(RAGService):
         Returns:
             List[Dict[str, Any]]: 関連ドキュメントのリスト
 
+        Raises:
+            ValueError: ベクトルストアが初期化されていない場合
+        """
+        vector_store = self._get_vector_store()
+
+        # クエリに関連するドキュメントをスコア(距離)付きで検索
+        docs_and_scores = vector_store.similarity_search_with_score(query, k=k)
+
+        # 結果を整形
+        return [
+            {'content': doc.page_content, 'metadata': doc.metadata, 'score': score}
+            for doc, score in docs_and_scores
+        ]
+
+    def _get_vector_store(self) -> 'FAISS':
+        """初期化済みのベクトルストアを取得します。
+
+        Returns:
+            FAISS: ベクトルストア
+
         Raises:
             ValueError: ベクトルストアが初期化されていない場合
         """
@@ -103,22 +160,22 @@ class FAISSRAGService(RAGService):
                 'ベクトルストアが初期化されていません。'
                 'initialize() を呼び出してください。'
             )
+        return self.vector_store
 
-        # クエリに関連するドキュメントを検索
-        docs = self.vector_store.similarity_search(query, k=k)
+    def _retrieve_docs(self, query: str, k: int = 3) -> list['Document']:
+        """クエリに関連するドキュメントを整形せずに取得します。
 
-        # 結果を整形
-        results = []
-        for doc in docs:
-            results.append(
-                {
-                    'content': doc.page_content,
-                    'metadata': doc.metadata,
-                    'score': getattr(doc, 'score', None),
-                }
-            )
+        Args:
+            query: 検索クエリ
+            k: 取得するドキュメントの数
 
-        return results
+        Returns:
+            list[Document]: 関連ドキュメントのリスト
+
+        Raises:
+            ValueError: ベクトルストアが初期化されていない場合
+        """
+        return self._get_vector_store().similarity_search(query, k=k)
 
 
 class CharacterRAGService(FAISSRAGService):
@@ -128,8 +185,13 @@ class CharacterRAGService(FAISSRAGService):
 
     Attributes:
         character_loader: キャラクター設定ローダー
+        _retrieve_cache: 正規化したクエリをキーとする検索結果のキャッシュ(LRU)
+        _retrieve_cache_lock: 検索結果キャッシュを保護するロック
     """
 
+    # 検索結果キャッシュの最大件数
+    RETRIEVE_CACHE_SIZE: int = 256
+
     def __init__(self, settings: Settings | None = None) -> None:
         """初期化メソッド。
 
@@ -140,19 +202,72 @@ class CharacterRAGService(FAISSRAGService):
         from src.human_like_ai.config.character import CharacterLoader
 
         self.character_loader = CharacterLoader(settings)
+        self._retrieve_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+        # 複数のエージェントのスレッドから共有されるため、キャッシュ操作を直列化する
+        self._retrieve_cache_lock = threading.Lock()
+
+    def initialize(self, documents: list[str]) -> None:
+        """RAGシステムを初期化し、検索結果キャッシュを破棄します。
+
+        Args:
+            documents: 初期化に使用するドキュメントのリスト
+        """
+        super().initialize(documents)
+        with self._retrieve_cache_lock:
+            self._retrieve_cache.clear()
 
     def initialize_from_character_sheet(self) -> None:
-        """キャラクターシートから RAG システムを初期化します。"""
+        """キャラクターシートから RAG システムを初期化します。
+
+        作成したインデックスはキャラクターシートの横に保存され、内容が変わっていない
+        場合は埋め込みを再計算せずに読み込みます。
+        """
+        from langchain_community.vectorstores import FAISS
+
         # キャラクターシートを読み込み
-        # character_data = self.character_loader.get_character_data()
         character_text = self.character_loader.get_character_text()
 
+        # 埋め込みモデルが変わった場合も作り直すよう、モデル名もハッシュに含める
+        digest = hashlib.sha256(
+            f'{self.embeddings.model}\n{character_text}'.encode()
+        ).hexdigest()
+        sheet_path = Path(self.character_loader.settings.character_sheet_path)
+        cache_dir = sheet_path.with_name(sheet_path.name + INDEX_CACHE_SUFFIX)
+        hash_file = cache_dir / INDEX_HASH_FILENAME
+
+        # 保存済みのインデックスが有効な場合は読み込む
+        try:
+            if hash_file.read_text(encoding='utf-8').strip() == digest:
+                self.vector_store = FAISS.load_local(
+                    str(cache_dir),
+                    self.embeddings,
+                    allow_dangerous_deserialization=True,
+                )
+                with self._retrieve_cache_lock:
+                    self._retrieve_cache.clear()
+                return
+        except (OSError, ValueError, RuntimeError, EOFError, pickle.UnpicklingError):
+            pass
+
         # RAGシステムを初期化
         self.initialize([character_text])
 
+        # インデックスの保存に失敗しても初期化自体は成功とする
+        # (保存途中のインデックスを読み込まないよう、ハッシュは保存後に書き込む)
+        if self.vector_store is not None:
+            try:
+                hash_file.unlink(missing_ok=True)
+                self.vector_store.save_local(str(cache_dir))
+                hash_file.write_text(digest, encoding='utf-8')
+            except (OSError, RuntimeError):
+                pass
+
     def retrieve_character_info(self, query: str, k: int = 3) -> str:
         """キャラクター情報を検索し、結果を文字列として返します。
 
+        同じクエリ(前後の空白と大文字小文字を無視)の結果はキャッシュから返し、
+        埋め込みAPIの呼び出しを省略します。
+
         Args:
             query: 検索クエリ
             k: 取得するドキュメントの数
@@ -160,5 +275,18 @@ class CharacterRAGService(FAISSRAGService):
         Returns:
             str: 検索結果の文字列表現
         """
-        results = self.retrieve(query, k)
-        return '\n\n'.join([result['content'] for result in results])
+        key = (query.strip().lower(), k)
+        with self._retrieve_cache_lock:
+            cached = self._retrieve_cache.get(key)
+            if cached is not None:
+                self._retrieve_cache.move_to_end(key)
+                return cached
+
+        # 検索中はロックを保持せず、他のスレッドのキャッシュ参照を妨げない
+        info = '\n\n'.join(doc.page_content for doc in self._retrieve_docs(query, k))
+        with self._retrieve_cache_lock:
+            self._retrieve_cache[key] = info
+            self._retrieve_cache.move_to_end(key)
+            if len(self._retrieve_cache) > self.RETRIEVE_CACHE_SIZE:
+                self._retrieve_cache.popitem(last=False)
+        return info
@@ -4,12 +4,14 @@
 このモジュールは、ユーザー入力から感情イベントを抽出するためのクラスを提供します。
 """
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
 from src.human_like_ai.config.settings import get_settings
 
+# 感情マネージャーへ渡すイベントのフィールド
+_EVENT_FIELDS: set[str] = {'target', 'label', 'strength'}
+
 
 class EmotionEvent(BaseModel):
     """感情イベントモデル。
@@ -48,8 +50,8 @@ class EmotionEventExtractor:
 
     Attributes:
         model: LLMモデル
-        prompt: プロンプトテンプレート
-        chain: LLMチェーン
+        chain: 構造化出力を返すLLMチェーン
+        _system_msg: 事前に生成したシステムメッセージ
     """
 
     def __init__(self, llm_model: str | None = None) -> None:
@@ -58,13 +60,15 @@ class EmotionEventExtractor:
         Args:
             llm_model: 使用するLLMモデル名。指定されない場合は設定から取得。
         """
+        # 起動時間短縮のため、重い依存はインスタンス生成時に読み込む
+        from langchain_openai import ChatOpenAI
+
         settings = get_settings()
         model_name = llm_model or settings.model_name
         self.model = ChatOpenAI(model=model_name, temperature=0)
-        self.prompt = ChatPromptTemplate.from_messages(
-            [('system', self._get_system_prompt()), ('human', '{input}')]
-        )
-        self.chain = self.prompt | self.model.with_structured_output(EmotionEvents)
+        # システムプロンプトは固定のため、テンプレートを介さず一度だけ生成する
+        self._system_msg = SystemMessage(content=self._get_system_prompt())
+        self.chain = self.model.with_structured_output(EmotionEvents)
 
     def _get_system_prompt(self) -> str:
         """システムプロンプトを取得します。
@@ -105,14 +109,8 @@ class EmotionEventExtractor:
             List[Dict[str, str]]: 抽出された感情イベントのリスト
                 各イベントは {'target': str, 'label': str, 'strength': str} の形式
         """
-        result = self.chain.invoke({'input': user_input})
+        result = self.chain.invoke([self._system_msg, HumanMessage(content=user_input)])
         if hasattr(result, 'events'):
-            return [
-                {
-                    'target': event.target,
-                    'label': event.label,
-                    'strength': event.strength,
-                }
-                for event in result.events
-            ]
+            # シリアライズは pydantic-core 側で行う
+            return [event.model_dump(include=_EVENT_FIELDS) for event in result.events]
         return []  # 感情イベントが抽出できなかった場合は空リストを返す
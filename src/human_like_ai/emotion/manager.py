@@ -5,12 +5,16 @@
 """
 
 import logging
-from datetime import datetime
+import time
+from array import array
+from collections.abc import Iterable, Mapping
 
 from src.human_like_ai.emotion.models import (
-    ALTERNATE_NAMES,
+    ALTERNATE_JP_NAMES,
+    BASIC_EMOTION_BY_VALUE,
+    BASIC_EMOTION_INDEX,
+    BASIC_EMOTIONS,
     COMPOUND_EMOTIONS,
-    DEFAULT_TIMEZONE,
     EVENT_STRENGTH_MAPPING,
     MIN_INTENSITY_THRESHOLD,
     OPPOSITE_EMOTIONS,
@@ -19,15 +23,31 @@ from src.human_like_ai.emotion.models import (
     get_intensity_category,
 )
 
-# モジュール専用のロガー設定
+# モジュール専用のロガー(レベルとハンドラは親ロガーの設定に従う)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.WARNING)
-if not logger.handlers:
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
-    ch.setFormatter(formatter)
-    logger.addHandler(ch)
+
+# 感情ラベルごとの集計値の初期値(BASIC_EMOTIONS の順に並ぶ)
+_ZERO_SUMS = array('d', [0.0] * len(BASIC_EMOTIONS))
+_ZERO_COUNTS = array('i', [0] * len(BASIC_EMOTIONS))
+
+# global_mood の初期値(インスタンスごとにコピーして使う)
+_EMPTY_MOOD: dict[BasicEmotion, float] = dict.fromkeys(BASIC_EMOTIONS, 0.0)
+
+
+def _format_emotion(label: BasicEmotion, intensity: float) -> str:
+    """感情と強度を表示用の文字列に整形します。
+
+    Args:
+        label: 基本感情のラベル
+        intensity: 感情の強度
+
+    Returns:
+        str: 「喜び: 0.50」や「怒り(激怒): 0.80」の形式の文字列
+    """
+    cat = get_intensity_category(label, intensity)
+    if cat == 'basic':
+        return f'{label.japanese}: {intensity:.2f}'
+    return f'{label.japanese}({ALTERNATE_JP_NAMES[(label, cat)]}): {intensity:.2f}'
 
 
 class EmotionManager:
@@ -40,16 +60,89 @@ class EmotionManager:
         emotions: 感情イベントのリスト
         global_mood: 全体的な感情状態
         _dirty: 更新フラグ
+        _index: (対象, 感情ラベル) をキーとする感情イベントの格納先
+        _sums: 感情ラベルごとの強度の合計(BASIC_EMOTIONS の順)
+        _counts: 感情ラベルごとのイベント数(BASIC_EMOTIONS の順)
+        _output_cache: 生成時の global_mood と出力文字列の組
     """
 
     def __init__(self) -> None:
         """初期化メソッド。"""
-        self.emotions: list[Emotion] = []
-        self.global_mood: dict[BasicEmotion, float] = dict.fromkeys(BasicEmotion, 0.0)
+        self._index: dict[tuple[str, BasicEmotion], Emotion] = {}
+        self._sums: array[float] = array('d', _ZERO_SUMS)
+        self._counts: array[int] = array('i', _ZERO_COUNTS)
+        self.global_mood: dict[BasicEmotion, float] = _EMPTY_MOOD.copy()
         self._dirty: bool = False
+        self._output_cache: tuple[dict[BasicEmotion, float], str] | None = None
+
+    @property
+    def emotions(self) -> list[Emotion]:
+        """感情イベントのリスト。
+
+        参照のたびに新しいリストを返すため、返されたリストを変更しても
+        内部状態には反映されません。入れ替える場合はリストごと代入してください。
+        """
+        return list(self._index.values())
+
+    @emotions.setter
+    def emotions(self, emotions: list[Emotion]) -> None:
+        self._rebuild_index(emotions)
+        self._output_cache = None
 
     # ── ヘルパーメソッド ──
 
+    def _rebuild_index(self, emotions: list[Emotion]) -> None:
+        """感情イベントのリストから格納先と集計値を再構築します。
+
+        Args:
+            emotions: 感情イベントのリスト
+        """
+        self._index = {(e.target, e.label): e for e in emotions}
+        sums = self._sums
+        counts = self._counts
+        sums[:] = _ZERO_SUMS
+        counts[:] = _ZERO_COUNTS
+        for e in self._index.values():
+            i = BASIC_EMOTION_INDEX[e.label]
+            sums[i] += e.intensity
+            counts[i] += 1
+
+    def _add_event(self, emotion: Emotion) -> None:
+        """感情イベントを追加し、集計値を更新します。
+
+        Args:
+            emotion: 追加する感情イベント
+        """
+        self._index[(emotion.target, emotion.label)] = emotion
+        i = BASIC_EMOTION_INDEX[emotion.label]
+        self._sums[i] += emotion.intensity
+        self._counts[i] += 1
+
+    def _remove_event(self, emotion: Emotion) -> None:
+        """感情イベントを削除し、集計値を更新します。
+
+        Args:
+            emotion: 削除する感情イベント
+        """
+        del self._index[(emotion.target, emotion.label)]
+        i = BASIC_EMOTION_INDEX[emotion.label]
+        self._counts[i] -= 1
+        if self._counts[i] == 0:
+            # 浮動小数点の誤差を持ち越さないようにリセット
+            self._sums[i] = 0.0
+        else:
+            self._sums[i] -= emotion.intensity
+
+    def _set_intensity(self, emotion: Emotion, intensity: float) -> None:
+        """感情イベントの強度を変更し、集計値を更新します。
+
+        Args:
+            emotion: 対象の感情イベント
+            intensity: 新しい強度
+        """
+        self._sums[BASIC_EMOTION_INDEX[emotion.label]] += intensity - emotion.intensity
+        emotion.intensity = intensity
+
     def _find_event(self, target: str, label: BasicEmotion) -> Emotion | None:
         """指定の対象と感情ラベルに合致するイベントを返します。
 
@@ -60,10 +153,7 @@ class EmotionManager:
         Returns:
             Optional[Emotion]: 合致するイベント、見つからない場合はNone
         """
-        for e in self.emotions:
-            if e.target == target and e.label == label:
-                return e
-        return None
+        return self._index.get((target, label))
 
     def _find_opposite_event(self, target: str, label: BasicEmotion) -> Emotion | None:
         """指定対象における反対感情のイベントを返します。
@@ -91,12 +181,10 @@ class EmotionManager:
         Returns:
             Optional[Dict[str, str]]: 複合感情の辞書、存在しない場合はNone
         """
-        be_set = {e.label for e in target_events}
-        if len(be_set) >= 2:  # 2つ以上の基本感情がある場合のみ
-            for compound_set, compound_info in COMPOUND_EMOTIONS.items():
-                if be_set == set(compound_set):
-                    return compound_info
-        return None
+        be_set = frozenset(e.label for e in target_events)
+        if len(be_set) < 2:  # 2つ以上の基本感情がある場合のみ
+            return None
+        return COMPOUND_EMOTIONS.get(be_set)
 
     def _commit_updates(self) -> None:
         """更新があった場合、global_mood を再計算し、dirty フラグをリセットします。"""
@@ -107,22 +195,41 @@ class EmotionManager:
 
     # ── イベント更新 ──
 
-    def update_emotion(self, label: BasicEmotion, target: str, strength: str) -> None:
+    def update_emotion(
+        self,
+        label: BasicEmotion,
+        target: str,
+        strength: str,
+        now: float | None = None,
+    ) -> None:
         """感情を更新します。
 
         Args:
             label: 基本感情のラベル
             target: 感情の対象
-            strength: 感情の強さ('weak', 'medium', 'strong')
+            strength: 感情の強さ('weak', 'medium', 'strong')。それ以外は無視されます。
+            now: 更新時刻(エポック秒)。省略時は現在時刻
         """
-        event_intensity = EVENT_STRENGTH_MAPPING.get(strength.lower(), 0.05)
+        event_intensity = EVENT_STRENGTH_MAPPING.get(strength.lower())
+        if event_intensity is None or event_intensity <= MIN_INTENSITY_THRESHOLD:
+            # 未知の強さや強度0のイベントでは状態を変更しない
+            logger.debug('update_emotion: 強さ %s のイベントを無視します。', strength)
+            return
+        if now is None:
+            now = time.time()
         logger.debug(
-            f'update_emotion: target={target}, label={label.value}, '
-            f'strength={strength}, event_intensity={event_intensity}'
+            'update_emotion: target=%s, label=%s, strength=%s, event_intensity=%s',
+            target,
+            label.value,
+            strength,
+            event_intensity,
         )
 
-        same_event = self._find_event(target, label)
-        opposite_event = self._find_opposite_event(target, label)
+        # 呼び出し回数が多いため、ヘルパーを経由せず索引を直接引く
+        index = self._index
+        same_event = index.get((target, label))
+        opposite_label = OPPOSITE_EMOTIONS.get(label)
+        opposite_event = index.get((target, opposite_label)) if opposite_label else None
 
         if opposite_event:
             new_opposite_intensity = (
@@ -130,25 +237,27 @@ class EmotionManager:
                 - event_intensity * opposite_event.amplification
             )
             logger.debug(
-                f'反対感情の相殺処理: {opposite_event.label.value} の'
-                f'新しい強度={new_opposite_intensity:.2f}'
+                '反対感情の相殺処理: %s の新しい強度=%.2f',
+                opposite_event.label.value,
+                new_opposite_intensity,
             )
             if new_opposite_intensity <= MIN_INTENSITY_THRESHOLD:
                 surplus = -new_opposite_intensity
-                self.emotions.remove(opposite_event)
+                self._remove_event(opposite_event)
                 logger.debug(
-                    f'反対感情イベント {opposite_event.label.value} を削除します。'
-                    f'余剰分={surplus:.2f}'
+                    '反対感情イベント %s を削除します。余剰分=%.2f',
+                    opposite_event.label.value,
+                    surplus,
                 )
                 if surplus > 0:
                     if same_event:
                         updated_intensity = (
                             same_event.intensity + surplus * same_event.amplification
                         )
-                        same_event.intensity = min(updated_intensity, 1.0)
-                        same_event.last_updated = datetime.now(DEFAULT_TIMEZONE)
+                        self._set_intensity(same_event, min(updated_intensity, 1.0))
+                        same_event.last_updated_ts = now
                         logger.debug(
-                            f'同一感情イベントを更新: 新強度={same_event.intensity:.2f}'
+                            '同一感情イベントを更新: 新強度=%.2f', same_event.intensity
                         )
                     else:
                         new_emotion = Emotion(
@@ -157,30 +266,33 @@ class EmotionManager:
                             target=target,
                             decay_rate=0.01,
                             amplification=1.0,
-                            last_updated=datetime.now(DEFAULT_TIMEZONE),
+                            last_updated_ts=now,
                         )
-                        self.emotions.append(new_emotion)
+                        self._add_event(new_emotion)
                         logger.debug(
-                            f'新しい感情イベントを追加: {label.value}、'
-                            f'強度={surplus:.2f}'
+                            '新しい感情イベントを追加: %s、強度=%.2f',
+                            label.value,
+                            surplus,
                         )
             else:
-                opposite_event.intensity = new_opposite_intensity
-                opposite_event.last_updated = datetime.now(DEFAULT_TIMEZONE)
+                self._set_intensity(opposite_event, new_opposite_intensity)
+                opposite_event.last_updated_ts = now
                 logger.debug(
-                    f'反対感情イベントの強度を更新: {opposite_event.label.value}、'
-                    f'新強度={new_opposite_intensity:.2f}'
+                    '反対感情イベントの強度を更新: %s、新強度=%.2f',
+                    opposite_event.label.value,
+                    new_opposite_intensity,
                 )
         else:
             if same_event:
                 updated_intensity = (
                     same_event.intensity + event_intensity * same_event.amplification
                 )
-                same_event.intensity = min(updated_intensity, 1.0)
-                same_event.last_updated = datetime.now(DEFAULT_TIMEZONE)
+                self._set_intensity(same_event, min(updated_intensity, 1.0))
+                same_event.last_updated_ts = now
                 logger.debug(
-                    f'既存イベントを更新: {label.value}、'
-                    f'新強度={same_event.intensity:.2f}'
+                    '既存イベントを更新: %s、新強度=%.2f',
+                    label.value,
+                    same_event.intensity,
                 )
             else:
                 new_emotion = Emotion(
@@ -189,46 +301,51 @@ class EmotionManager:
                     target=target,
                     decay_rate=0.01,
                     amplification=1.0,
-                    last_updated=datetime.now(DEFAULT_TIMEZONE),
+                    last_updated_ts=now,
                 )
-                self.emotions.append(new_emotion)
+                self._add_event(new_emotion)
                 logger.debug(
-                    f'新しいイベントを追加: {label.value}、強度={event_intensity:.2f}'
+                    '新しいイベントを追加: %s、強度=%.2f', label.value, event_intensity
                 )
         self._dirty = True
 
-    def update_from_llm(self, events: list[dict[str, str]]) -> None:
+    def update_from_llm(self, events: Iterable[Mapping[str, str]]) -> None:
         """LLMからの感情イベントリストで更新します。
 
+        ラベルが未知のイベントや対象が空のイベントは無視します。
+
         Args:
-            events: 感情イベントのリスト
+            events: 感情イベントのイテラブル(ジェネレータも可)
                 各イベントは {'target': str, 'label': str, 'strength': str} の形式
         """
+        now = time.time()
+        # ループ内で繰り返し参照するものはローカル変数に束縛しておく
+        get_label = BASIC_EMOTION_BY_VALUE.get
+        update_emotion = self.update_emotion
         for event in events:
-            label_str = event.get('label', '').lower()
-            try:
-                label = BasicEmotion(label_str)
-            except ValueError:
+            # 検証を先に行い、無効なイベントでは文字列処理をしない
+            raw_label = event.get('label')
+            if not raw_label:
                 continue
-            target = event.get('target', '').strip()
-            strength = event.get('strength', 'medium')
-            self.update_emotion(label, target, strength)
+            label = get_label(raw_label.lower())
+            if label is None:
+                continue
+            target = (event.get('target') or '').strip()
+            if not target:
+                continue
+            strength = event.get('strength') or 'medium'
+            update_emotion(label, target, strength, now)
         self._commit_updates()
 
     def update_global_mood(self) -> None:
         """全体的な感情状態を更新します。"""
-        sums: dict[BasicEmotion, float] = dict.fromkeys(BasicEmotion, 0.0)
-        counts: dict[BasicEmotion, int] = dict.fromkeys(BasicEmotion, 0)
-        for e in self.emotions:
-            sums[e.label] += e.intensity
-            counts[e.label] += 1
-        self.global_mood = {}
-        for be in BasicEmotion:
-            if counts[be] > 0:
-                self.global_mood[be] = sums[be] / counts[be]
-            else:
-                self.global_mood[be] = 0.0
-        logger.debug(f'Global mood 更新: {self.global_mood}')
+        self.global_mood = {
+            be: total / count if count > 0 else 0.0
+            for be, total, count in zip(
+                BASIC_EMOTIONS, self._sums, self._counts, strict=True
+            )
+        }
+        logger.debug('Global mood 更新: %s', self.global_mood)
 
     # ── イベントの減衰および削除 ──
 
@@ -238,22 +355,35 @@ class EmotionManager:
         Args:
             unit_seconds: 減衰の単位時間(秒)
         """
-        now = datetime.now(DEFAULT_TIMEZONE)
-        updated_events = []
-        for e in self.emotions:
-            elapsed = (now - e.last_updated).total_seconds()
+        now = time.time()
+        # 残ったイベントから格納先と集計値を同じ走査で再構築する
+        index: dict[tuple[str, BasicEmotion], Emotion] = {}
+        sums = self._sums
+        counts = self._counts
+        sums[:] = _ZERO_SUMS
+        counts[:] = _ZERO_COUNTS
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for e in self._index.values():
+            elapsed = now - e.last_updated_ts
             units = elapsed / unit_seconds
             decay_amount = e.decay_rate * units
             new_intensity = max(0, e.intensity - decay_amount)
-            logger.debug(
-                f'apply_decay: {e.label.value} の経過秒数={elapsed:.2f}, '
-                f'減衰量={decay_amount:.2f}, 新強度={new_intensity:.2f}'
-            )
+            if debug:
+                logger.debug(
+                    'apply_decay: %s の経過秒数=%.2f, 減衰量=%.2f, 新強度=%.2f',
+                    e.label.value,
+                    elapsed,
+                    decay_amount,
+                    new_intensity,
+                )
             e.intensity = new_intensity
-            e.last_updated = now
-            if e.intensity > MIN_INTENSITY_THRESHOLD:
-                updated_events.append(e)
-        self.emotions = updated_events
+            e.last_updated_ts = now
+            if new_intensity > MIN_INTENSITY_THRESHOLD:
+                index[(e.target, e.label)] = e
+                i = BASIC_EMOTION_INDEX[e.label]
+                sums[i] += new_intensity
+                counts[i] += 1
+        self._index = index
         self._dirty = True
         self._commit_updates()
 
@@ -262,47 +392,43 @@ class EmotionManager:
     def generate_output(self) -> str:
         """感情状態の出力を生成します。
 
+        状態が変わっていなければ前回生成した文字列を返します。
+        感情イベントの更新は必ず global_mood の再計算(辞書の差し替え)を伴うため、
+        global_mood が前回と同じオブジェクトであることを変更なしとみなします。
+
         Returns:
             str: 感情状態の文字列表現
         """
         self._commit_updates()
-
-        lines = []
-        lines.append('# 基本感情')
-        global_parts = []
-        nonzero = False
-        for be in BasicEmotion:
-            total = self.global_mood.get(be, 0.0)
-            if total > 0:
-                nonzero = True
-                cat = get_intensity_category(be, total)
-                if cat == 'basic':
-                    part = f'{be.japanese}: {total:.2f}'
-                else:
-                    alt = ALTERNATE_NAMES[be][cat]['jp']
-                    part = f'{be.japanese}({alt}): {total:.2f}'
-                global_parts.append(part)
-        lines.append('、'.join(global_parts) if nonzero else 'ニュートラル')
-        lines.append('')
-        lines.append('# 対象毎の感情')
-        targets = {e.target for e in self.emotions}
-        for target in targets:
-            target_events = [
-                e for e in self.emotions if e.target == target and e.intensity > 0
-            ]
-            event_parts = []
-            for e in target_events:
-                cat = get_intensity_category(e.label, e.intensity)
-                if cat == 'basic':
-                    part = f'{e.label.japanese}: {e.intensity:.2f}'
-                else:
-                    alt = ALTERNATE_NAMES[e.label][cat]['jp']
-                    part = f'{e.label.japanese}({alt}): {e.intensity:.2f}'
-                event_parts.append(part)
+        cache = self._output_cache
+        if cache is not None and cache[0] is self.global_mood:
+            return cache[1]
+
+        global_parts = [
+            _format_emotion(be, total)
+            for be in BASIC_EMOTIONS
+            if (total := self.global_mood.get(be, 0.0)) > 0
+        ]
+        lines = [
+            '# 基本感情',
+            '、'.join(global_parts) if global_parts else 'ニュートラル',
+            '',
+            '# 対象毎の感情',
+        ]
+        # 対象ごとのイベントと表示文字列を1回の走査でまとめる(強度0は表示しない)
+        groups: dict[str, tuple[list[Emotion], list[str]]] = {}
+        for e in self._index.values():
+            target_events, event_parts = groups.setdefault(e.target, ([], []))
+            if e.intensity > 0:
+                target_events.append(e)
+                event_parts.append(_format_emotion(e.label, e.intensity))
+        for target, (target_events, event_parts) in groups.items():
             compound = self._derive_compound_emotion(target_events)
             compound_str = f'、複合感情: {compound["jp"]}' if compound else ''
-            lines.append(f'[{target}] ' + '、'.join(event_parts) + compound_str)
-        return '\n'.join(lines)
+            lines.append(f'[{target}] {"、".join(event_parts)}{compound_str}')
+        output = '\n'.join(lines)
+        self._output_cache = (self.global_mood, output)
+        return output
 
     def get_emotions(self) -> list[Emotion]:
         """感情イベントのリストを取得します。
@@ -4,12 +4,12 @@
 このモジュールは、感情の基本モデルと関連する定数を定義します。
 """
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field
-
 from src.human_like_ai.config.settings import get_settings
 
 # タイムゾーン設定
@@ -42,18 +42,31 @@ class BasicEmotion(Enum):
         Returns:
             str: 感情の日本語名
         """
-        mapping = {
-            BasicEmotion.JOY: '喜び',
-            BasicEmotion.ANTICIPATION: '期待',
-            BasicEmotion.ANGER: '怒り',
-            BasicEmotion.DISGUST: '嫌悪',
-            BasicEmotion.SADNESS: '悲しみ',
-            BasicEmotion.SURPRISE: '驚き',
-            BasicEmotion.FEAR: '恐れ',
-            BasicEmotion.TRUST: '信頼',
-        }
-        return mapping[self]
+        return JAPANESE_NAMES[self]
+
+
+# 基本感情の日本語名
+JAPANESE_NAMES: dict[BasicEmotion, str] = {
+    BasicEmotion.JOY: '喜び',
+    BasicEmotion.ANTICIPATION: '期待',
+    BasicEmotion.ANGER: '怒り',
+    BasicEmotion.DISGUST: '嫌悪',
+    BasicEmotion.SADNESS: '悲しみ',
+    BasicEmotion.SURPRISE: '驚き',
+    BasicEmotion.FEAR: '恐れ',
+    BasicEmotion.TRUST: '信頼',
+}
 
+# 基本感情の一覧(定義順)
+BASIC_EMOTIONS: tuple[BasicEmotion, ...] = tuple(BasicEmotion)
+
+# 値(英語のラベル)から基本感情への索引
+BASIC_EMOTION_BY_VALUE: dict[str, BasicEmotion] = {be.value: be for be in BasicEmotion}
+
+# 基本感情から BASIC_EMOTIONS 上の位置への索引
+BASIC_EMOTION_INDEX: dict[BasicEmotion, int] = {
+    be: i for i, be in enumerate(BASIC_EMOTIONS)
+}
 
 # LLMからのイベント更新用強さマッピング
 EVENT_STRENGTH_MAPPING: dict[str, float] = {
@@ -98,6 +111,13 @@ ALTERNATE_NAMES: dict[BasicEmotion, dict[str, dict[str, str]]] = {
     },
 }
 
+# (基本感情, 強さカテゴリ) から別名(日本語)への平坦な索引
+ALTERNATE_JP_NAMES: dict[tuple[BasicEmotion, str], str] = {
+    (be, cat): names['jp']
+    for be, categories in ALTERNATE_NAMES.items()
+    for cat, names in categories.items()
+}
+
 # 応用感情(複合感情)のマスタ
 COMPOUND_EMOTIONS: dict[frozenset[BasicEmotion], dict[str, str]] = {
     frozenset({BasicEmotion.ANTICIPATION, BasicEmotion.JOY}): {
@@ -225,32 +245,54 @@ def get_intensity_category(emotion: BasicEmotion, intensity: float) -> str:
         return 'strong'
 
 
-class Emotion(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Emotion:
     """感情モデル。
 
     特定の対象に対する感情の状態を表します。
+    更新処理のたびに生成・変更されるため、検証は生成時の範囲チェックのみとし、
+    属性の変更時には検証しません。
 
     Attributes:
         label: 基本感情のラベル
         intensity: 感情の累積状態の強さ(0.0〜1.0)
         target: 感情の対象
-        decay_rate: 単位時間あたりの減衰率
-        amplification: 増幅係数
-        last_updated: 最終更新時刻
+        decay_rate: 単位時間あたりの減衰率(例: 1分あたり1%減少)
+        amplification: 増幅係数(同一対象で同じ感情が連続する際に掛け合わせる)
+        last_updated_ts: 最終更新時刻(エポック秒)
     """
 
-    label: BasicEmotion = Field(..., description='基本感情のラベル')
-    intensity: float = Field(0, description='感情の累積状態の強さ', ge=0, le=1)
-    target: str = Field(..., description='感情の対象')
-    decay_rate: float = Field(
-        0.01, description='単位時間あたりの減衰率(例: 1分あたり1%減少)', ge=0, le=1
-    )
-    amplification: float = Field(
-        1.0,
-        description='増幅係数(同一対象で同じ感情が連続する際に掛け合わせる)',
-        ge=0,
-    )
-    last_updated: datetime = Field(
-        default_factory=lambda: datetime.now(DEFAULT_TIMEZONE),
-        description='最終更新時刻',
-    )
+    label: BasicEmotion
+    intensity: float = 0.0
+    target: str
+    decay_rate: float = 0.01
+    amplification: float = 1.0
+    last_updated_ts: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        """値の範囲を検証します。
+
+        Raises:
+            ValueError: 強度、減衰率、増幅係数が範囲外の場合
+        """
+        if not 0 <= self.intensity <= 1:
+            raise ValueError(
+                f'intensity は0から1の範囲で指定してください: {self.intensity}'
+            )
+        if not 0 <= self.decay_rate <= 1:
+            raise ValueError(
+                f'decay_rate は0から1の範囲で指定してください: {self.decay_rate}'
+            )
+        if self.amplification < 0:
+            raise ValueError(
+                f'amplification は0以上で指定してください: {self.amplification}'
+            )
+
+    @property
+    def last_updated(self) -> datetime:
+        """最終更新時刻(DEFAULT_TIMEZONE のタイムゾーン付き)。"""
+        return datetime.fromtimestamp(self.last_updated_ts, DEFAULT_TIMEZONE)
+
+    @last_updated.setter
+    def last_updated(self, value: datetime) -> None:
+        self.last_updated_ts = value.timestamp()
@@ -8,6 +8,9 @@
 
 import argparse
 import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
 
 from src.human_like_ai.config.settings import Settings, get_settings
 from src.human_like_ai.core.agent import AgentFactory
@@ -52,18 +55,17 @@ def create_settings_from_args(args: argparse.Namespace) -> Settings | None:
     if not any(vars(args).values()):
         return None
 
-    # デフォルト設定を取得
-    settings = get_settings()
-
     # 引数で指定された値で設定を上書き
+    overrides: dict[str, Any] = {}
     if args.model:
-        settings.model_name = args.model
+        overrides['model_name'] = args.model
     if args.temperature is not None:
-        settings.temperature = args.temperature
+        overrides['temperature'] = args.temperature
     if args.character_sheet:
-        settings.character_sheet_path = args.character_sheet
+        overrides['character_sheet_path'] = Path(args.character_sheet)
 
-    return settings
+    # デフォルト設定を元に、上書きした設定のコピーを作成
+    return replace(get_settings(), **overrides)
 
 
 def main() -> None:
@@ -4,14 +4,34 @@ LLM関連ユーティリティモジュール。
 このモジュールは、LLMとの対話を行うためのユーティリティクラスを提供します。
 """
 
-from typing import Any
+import functools
+from typing import TYPE_CHECKING, Any
 
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 
 from src.human_like_ai.config.settings import Settings, get_settings
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+@functools.lru_cache(maxsize=4)
+def _get_chat_model(model_name: str, temperature: float) -> 'ChatOpenAI':
+    """モデル名と温度ごとに共有するチャットモデルを取得します。
+
+    Args:
+        model_name: 使用するLLMモデル名
+        temperature: 生成時の温度
+
+    Returns:
+        ChatOpenAI: チャットモデル
+    """
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model=model_name, temperature=temperature)
+
 
 class LLMService:
     """LLMサービスクラス。
@@ -20,7 +40,7 @@ class LLMService:
 
     Attributes:
         settings: アプリケーション設定
-        model: LLMモデル
+        model: LLMモデル(初回アクセス時に生成)
     """
 
     def __init__(self, settings: Settings | None = None) -> None:
@@ -30,36 +50,101 @@ class LLMService:
             settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
         """
         self.settings = settings or get_settings()
-        self.model = ChatOpenAI(
-            model=self.settings.model_name,
-            temperature=self.settings.temperature,
-        )
 
-    def generate(self, context: dict[str, Any]) -> str:
-        """LLMを使用して応答を生成します。
+    @functools.cached_property
+    def model(self) -> 'ChatOpenAI':
+        """LLMモデル。
+
+        同じモデル名と温度の LLMService 間で共有されます。
+        """
+        return _get_chat_model(self.settings.model_name, self.settings.temperature)
+
+    @staticmethod
+    def _extract(response: object) -> str:
+        """LLMの応答から本文を取り出します。
+
+        Args:
+            response: LLMの応答
+
+        Returns:
+            str: 応答の本文
+        """
+        if hasattr(response, 'content'):
+            return str(response.content)
+        return str(response)
+
+    @staticmethod
+    def _build_messages(context: dict[str, Any]) -> list[BaseMessage]:
+        """プロンプトコンテキストからメッセージリストを組み立てます。
 
         Args:
             context: プロンプトコンテキスト
 
         Returns:
-            str: 生成された応答
+            List[BaseMessage]: メッセージリスト
+
+        Raises:
+            ValueError: プロンプトテンプレートもメッセージも含まれていない場合
         """
         # プロンプトテンプレートが提供されている場合は使用
+        # (同じコンテキストを再利用できるよう、呼び出し元の辞書は変更しない)
         if 'prompt_template' in context:
-            prompt_template = context.pop('prompt_template')
-            messages = prompt_template.format_prompt(**context).to_messages()
+            prompt_template: ChatPromptTemplate = context['prompt_template']
+            variables = {k: v for k, v in context.items() if k != 'prompt_template'}
+            return prompt_template.format_prompt(**variables).to_messages()
         # メッセージが直接提供されている場合は使用
-        elif 'messages' in context:
-            messages = context['messages']
+        if 'messages' in context:
+            messages: list[BaseMessage] = context['messages']
+            return messages
         # それ以外の場合はエラー
-        else:
-            raise ValueError('プロンプトテンプレートまたはメッセージが必要です。')
+        raise ValueError('プロンプトテンプレートまたはメッセージが必要です。')
+
+    def generate(self, context: dict[str, Any]) -> str:
+        """LLMを使用して応答を生成します。
+
+        Args:
+            context: プロンプトコンテキスト
+
+        Returns:
+            str: 生成された応答
+        """
+        messages = self._build_messages(context)
 
         # LLMを呼び出して応答を生成
-        response = self.model.invoke(messages)
-        if hasattr(response, 'content'):
-            return str(response.content)
-        return str(response)
+        return self._extract(self.model.invoke(messages))
+
+    def generate_batch(self, contexts: list[dict[str, Any]]) -> list[str]:
+        """複数のプロンプトコンテキストから応答をまとめて生成します。
+
+        互いに独立したプロンプトが複数ある場合は、generate を繰り返し呼ぶより
+        こちらを使用してください。リクエストは並行して送信されます。
+
+        Args:
+            contexts: プロンプトコンテキストのリスト
+
+        Returns:
+            List[str]: 各コンテキストに対する応答(入力と同じ順序)
+        """
+        all_messages: list[LanguageModelInput] = [
+            self._build_messages(context) for context in contexts
+        ]
+        responses = self.model.batch(all_messages)
+        return [self._extract(response) for response in responses]
+
+    async def agenerate_batch(self, contexts: list[dict[str, Any]]) -> list[str]:
+        """generate_batch の非同期版です。
+
+        Args:
+            contexts: プロンプトコンテキストのリスト
+
+        Returns:
+            List[str]: 各コンテキストに対する応答(入力と同じ順序)
+        """
+        all_messages: list[LanguageModelInput] = [
+            self._build_messages(context) for context in contexts
+        ]
+        responses = await self.model.abatch(all_messages)
+        return [self._extract(response) for response in responses]
 
     def generate_with_messages(self, messages: list[BaseMessage]) -> str:
         """メッセージリストを使用して応答を生成します。
@@ -70,10 +155,7 @@ class LLMService:
         Returns:
             str: 生成された応答
         """
-        response = self.model.invoke(messages)
-        if hasattr(response, 'content'):
-            return str(response.content)
-        return str(response)
+        return self._extract(self.model.invoke(messages))
 
     def generate_with_prompt(
         self, prompt_template: ChatPromptTemplate, **kwargs: dict[str, Any]
@@ -88,7 +170,4 @@ class LLMService:
             str: 生成された応答
         """
         messages = prompt_template.format_prompt(**kwargs).to_messages()
-        response = self.model.invoke(messages)
-        if hasattr(response, 'content'):
-            return str(response.content)
-        return str(response)
+        return self._extract(self.model.invoke(messages))
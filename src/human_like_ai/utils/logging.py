@@ -39,6 +39,10 @@ def setup_logger(
     logger.setLevel(level)
     logger.propagate = False
 
+    # 同じ出力先のハンドラが設定済みであれば再設定しない
+    if _has_handlers(logger, log_file, log_to_console):
+        return logger
+
     # 既存のハンドラをクリア
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -69,9 +73,38 @@ def setup_logger(
     return logger
 
 
+def _has_handlers(
+    logger: logging.Logger, log_file: str | None, log_to_console: bool
+) -> bool:
+    """ロガーに指定の出力先のハンドラだけが設定済みかどうかを判定します。
+
+    Args:
+        logger: 判定するロガー
+        log_file: ログファイルパス
+        log_to_console: コンソールにログを出力するかどうか
+
+    Returns:
+        bool: 設定済みの場合はTrue
+    """
+    if not logger.handlers:
+        return False
+    file_names = {
+        h.baseFilename for h in logger.handlers if isinstance(h, logging.FileHandler)
+    }
+    has_console = any(
+        type(h) is logging.StreamHandler and h.stream is sys.stdout
+        for h in logger.handlers
+    )
+    expected_files = {os.path.abspath(log_file)} if log_file else set()
+    return file_names == expected_files and has_console == log_to_console
+
+
 def get_default_logger(settings: Settings | None = None) -> logging.Logger:
     """デフォルトのロガーを取得します。
 
+    設定済みのハンドラは setup_logger が再利用するため、何度呼び出しても
+    ハンドラは重複しません。他の出力先で再設定されていた場合は元に戻します。
+
     Args:
         settings: アプリケーション設定。指定されない場合はデフォルト設定を使用。
 
@@ -95,7 +128,3 @@ def get_default_logger(settings: Settings | None = None) -> logging.Logger:
         log_to_console=True,
         settings=settings,
     )
-
-
-# モジュールレベルのロガー
-logger = get_default_logger()
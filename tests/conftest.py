@@ -4,16 +4,17 @@
 このモジュールは、テスト全体で使用するフィクスチャやヘルパー関数を提供します。
 """
 
-import os
 from collections.abc import Generator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.config.settings import Settings, get_settings
 
 
+@dataclass(frozen=True, slots=True)
 class MockSettings(Settings):
     """テスト用のモック設定クラス。
 
@@ -29,9 +30,18 @@ class MockSettings(Settings):
     timezone: str = 'UTC'
 
 
-@pytest.fixture
-def mock_settings() -> MockSettings:
-    """テスト用のモック設定を提供します。
+# テスト用の環境変数
+_TEST_ENV: dict[str, str] = {
+    'OPENAI_API_KEY': 'test-api-key',
+    'MODEL_NAME': 'test-model',
+    'TEMPERATURE': '0.0',
+    'TIMEZONE': 'UTC',
+}
+
+
+@pytest.fixture(scope='session')
+def _base_settings() -> MockSettings:
+    """セッション全体で共有するモック設定を提供します。
 
     Returns:
         MockSettings: テスト用のモック設定
@@ -40,9 +50,27 @@ def mock_settings() -> MockSettings:
 
 
 @pytest.fixture
+def mock_settings(_base_settings: MockSettings) -> MockSettings:
+    """テスト用のモック設定を提供します。
+
+    設定は不変のため共有インスタンスをそのまま返します。
+    値を変更する場合は dataclasses.replace() でコピーを作成してください。
+
+    Args:
+        _base_settings: セッション全体で共有するモック設定
+
+    Returns:
+        MockSettings: テスト用のモック設定
+    """
+    return _base_settings
+
+
+@pytest.fixture(scope='session')
 def test_character_data() -> dict[str, Any]:
     """テスト用のキャラクターデータを提供します。
 
+    セッション全体で共有されるため、テスト内で変更しないでください。
+
     Returns:
         Dict[str, Any]: テスト用のキャラクターデータ
     """
@@ -78,7 +106,7 @@ def test_character_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_character_yaml(test_character_data: dict[str, Any]) -> str:
     """テスト用のキャラクターYAMLを提供します。
 
@@ -90,47 +118,81 @@ def test_character_yaml(test_character_data: dict[str, Any]) -> str:
     """
     import yaml
 
-    return yaml.dump(test_character_data, allow_unicode=True)
+    # libyaml が利用可能であればCダンパーを使用する
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml.dump(test_character_data, Dumper=dumper, allow_unicode=True)
+
+
+@pytest.fixture(scope='session')
+def _test_character_bytes(test_character_yaml: str) -> bytes:
+    """テスト用のキャラクターYAMLをエンコードしたバイト列を提供します。
+
+    Args:
+        test_character_yaml: テスト用のキャラクターYAML
+
+    Returns:
+        bytes: UTF-8 でエンコードしたキャラクターYAML
+    """
+    return test_character_yaml.encode('utf-8')
 
 
 @pytest.fixture
-def test_character_file(tmp_path: Path, test_character_yaml: str) -> Path:
+def test_character_file(tmp_path: Path, _test_character_bytes: bytes) -> Path:
     """テスト用のキャラクターファイルを作成します。
 
+    ローダーはキャラクターシートの横にキャッシュファイルを書き込むため、
+    テスト間でキャッシュを共有しないよう、テストごとに一時ディレクトリへ作成します。
+
     Args:
-        tmp_path: 一時ディレクトリのパス
-        test_character_yaml: テスト用のキャラクターYAML
+        tmp_path: 一時ディレクトリ
+        _test_character_bytes: エンコード済みのキャラクターYAML
 
     Returns:
         Path: テスト用のキャラクターファイルのパス
     """
-    data_dir = tmp_path / 'data'
-    data_dir.mkdir(exist_ok=True)
-    file_path = data_dir / 'test_character_sheet.yaml'
-    file_path.write_text(test_character_yaml, encoding='utf-8')
+    file_path = tmp_path / 'test_character_sheet.yaml'
+    file_path.write_bytes(_test_character_bytes)
     return file_path
 
 
+@pytest.fixture(scope='session')
+def parsed_character(test_character_yaml: str) -> dict[str, Any]:
+    """テスト用のキャラクターYAMLを解析したデータを提供します。
+
+    セッション全体で共有されるため、テスト内で変更しないでください。
+
+    Args:
+        test_character_yaml: テスト用のキャラクターYAML
+
+    Returns:
+        Dict[str, Any]: 解析済みのキャラクターデータ
+    """
+    import yaml
+
+    # libyaml が利用可能であればCローダーを使用する
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(test_character_yaml, Loader=loader)
+
+
 @pytest.fixture
-def mock_env_vars() -> Generator[None, None, None]:
+def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
     """テスト用の環境変数を設定します。
 
     テスト終了後に元の環境変数に戻します。
 
+    Args:
+        monkeypatch: pytest の monkeypatch フィクスチャ
+
     Yields:
         None
     """
-    # 元の環境変数を保存
-    original_env = os.environ.copy()
+    # テスト用の環境変数を設定(終了時に monkeypatch が元に戻す)
+    for key, value in _TEST_ENV.items():
+        monkeypatch.setenv(key, value)
 
-    # テスト用の環境変数を設定
-    os.environ['OPENAI_API_KEY'] = 'test-api-key'
-    os.environ['MODEL_NAME'] = 'test-model'
-    os.environ['TEMPERATURE'] = '0.0'
-    os.environ['TIMEZONE'] = 'UTC'
+    # キャッシュされた設定を破棄して環境変数を再読み込みさせる
+    get_settings.cache_clear()
 
     yield
 
-    # 元の環境変数に戻す
-    os.environ.clear()
-    os.environ.update(original_env)
+    get_settings.cache_clear()
@@ -4,7 +4,11 @@
 このモジュールは、キャラクター設定モジュールの機能をテストします。
 """
 
+import os
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -12,6 +16,9 @@ import yaml
 from src.human_like_ai.config.character import CharacterLoader
 from src.human_like_ai.config.settings import Settings
 
+# libyaml が利用可能であればCローダーを使用する
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def test_character_loader_init(mock_settings: Settings) -> None:
     """CharacterLoaderの初期化テスト。"""
@@ -21,17 +28,20 @@ def test_character_loader_init(mock_settings: Settings) -> None:
 
 
 def test_character_loader_load(
-    test_character_file: Path, mock_settings: Settings
+    test_character_file: Path,
+    parsed_character: dict[str, Any],
+    mock_settings: Settings,
 ) -> None:
     """キャラクター設定の読み込みテスト。"""
     # 設定のパスを一時ファイルに変更
-    mock_settings.character_sheet_path = test_character_file
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
 
     # ローダーの作成と読み込み
     loader = CharacterLoader(mock_settings)
     data = loader.load()
 
     # データの検証
+    assert data == parsed_character
     assert 'basic_info' in data
     assert data['basic_info']['name'] == '北条 楓'
     assert 'personality' in data
@@ -39,10 +49,12 @@ def test_character_loader_load(
     assert '明るい' in data['personality']['traits']
 
 
-def test_character_loader_load_file_not_found() -> None:
+def test_character_loader_load_file_not_found(mock_settings: Settings) -> None:
     """存在しないファイルの読み込みテスト。"""
-    loader = CharacterLoader()
-    loader.settings.character_sheet_path = Path('/non/existent/path.yaml')
+    mock_settings = replace(
+        mock_settings, character_sheet_path=Path('/non/existent/path.yaml')
+    )
+    loader = CharacterLoader(mock_settings)
 
     with pytest.raises(FileNotFoundError):
         loader.load()
@@ -53,7 +65,7 @@ def test_character_loader_get_character_data(
 ) -> None:
     """キャラクターデータの取得テスト。"""
     # 設定のパスを一時ファイルに変更
-    mock_settings.character_sheet_path = test_character_file
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
 
     # ローダーの作成
     loader = CharacterLoader(mock_settings)
@@ -76,7 +88,7 @@ def test_character_loader_get_character_text(
 ) -> None:
     """キャラクターテキストの取得テスト。"""
     # 設定のパスを一時ファイルに変更
-    mock_settings.character_sheet_path = test_character_file
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
 
     # ローダーの作成
     loader = CharacterLoader(mock_settings)
@@ -86,6 +98,95 @@ def test_character_loader_get_character_text(
     assert isinstance(text, str)
 
     # テキストからデータを復元して検証
-    data = yaml.safe_load(text)
+    data = yaml.load(text, Loader=_Loader)
     assert 'basic_info' in data
     assert data['basic_info']['name'] == '北条 楓'
+
+
+def test_character_loader_get_character_text_cache(
+    test_character_file: Path, mock_settings: Settings
+) -> None:
+    """キャラクターテキストのキャッシュテスト。"""
+    # 設定のパスを一時ファイルに変更
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
+
+    # ローダーの作成
+    loader = CharacterLoader(mock_settings)
+
+    # 2回目以降はキャッシュされたテキストが返される
+    text = loader.get_character_text()
+    assert loader.get_character_text() is text
+
+    # 再読み込みするとメモリ上のキャッシュが破棄される
+    loader._character_text = 'stale'
+    loader.load()
+    assert loader._character_text != 'stale'
+    assert loader.get_character_text() == text
+
+
+def test_character_loader_load_from_cache(
+    test_character_file: Path, mock_settings: Settings
+) -> None:
+    """キャッシュファイルからの読み込みテスト。"""
+    # 設定のパスを一時ファイルに変更
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
+
+    # 読み込み後はキャッシュファイルが存在する
+    loader = CharacterLoader(mock_settings)
+    data = loader.load()
+    text = loader.get_character_text()
+    assert test_character_file.with_name(test_character_file.name + '.pickle').exists()
+    assert test_character_file.with_name(test_character_file.name + '.txt').exists()
+
+    # 2回目以降はYAMLを解析せずにキャッシュから読み込む
+    with patch('src.human_like_ai.config.character.yaml') as mock_yaml:
+        cached_loader = CharacterLoader(mock_settings)
+        assert cached_loader.load() == data
+        assert cached_loader.get_character_text() == text
+        assert not mock_yaml.load.called
+        assert not mock_yaml.dump.called
+
+
+def test_character_loader_stale_cache(
+    test_character_file: Path, mock_settings: Settings
+) -> None:
+    """キャラクターシートが更新された場合にキャッシュを使わないことのテスト。"""
+    # 設定のパスを一時ファイルに変更
+    mock_settings = replace(mock_settings, character_sheet_path=test_character_file)
+
+    # 読み込んでキャッシュファイルを作成
+    loader = CharacterLoader(mock_settings)
+    loader.load()
+    old_text = loader.get_character_text()
+
+    # キャッシュより新しい更新時刻でキャラクターシートを書き換える
+    test_character_file.write_text('basic_info:\n  name: 別の名前\n', encoding='utf-8')
+    text_cache = test_character_file.with_name(test_character_file.name + '.txt')
+    newer = text_cache.stat().st_mtime + 10
+    os.utime(test_character_file, (newer, newer))
+
+    # キャッシュではなく更新後のキャラクターシートが読み込まれる
+    data = loader.load()
+    assert data == {'basic_info': {'name': '別の名前'}}
+    text = loader.get_character_text()
+    assert text != old_text
+    assert yaml.load(text, Loader=_Loader) == data
+
+
+def test_character_loader_empty_data_not_reloaded(
+    tmp_path: Path, mock_settings: Settings
+) -> None:
+    """空のキャラクターデータ読み込み後に再読み込みされないことのテスト。"""
+    # 空のマッピングのみを含むキャラクターシート
+    file_path = tmp_path / 'empty_character_sheet.yaml'
+    file_path.write_text('{}\n', encoding='utf-8')
+    mock_settings = replace(mock_settings, character_sheet_path=file_path)
+
+    loader = CharacterLoader(mock_settings)
+    assert loader.get_character_data() == {}
+
+    # 読み込み済みのため load() は呼ばれない
+    with patch.object(loader, 'load') as mock_load:
+        assert loader.get_character_data() == {}
+        loader.get_character_text()
+        assert not mock_load.called
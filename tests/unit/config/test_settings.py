@@ -4,9 +4,11 @@
 このモジュールは、設定モジュールの機能をテストします。
 """
 
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
 from src.human_like_ai.config.settings import Settings, get_settings
@@ -46,26 +48,34 @@ def test_get_settings_with_env_vars(mock_env_vars: None) -> None:
     assert settings.timezone == 'UTC'
 
 
-def test_get_settings_with_missing_env_vars(monkeypatch: MonkeyPatch) -> None:
-    """環境変数が不足している場合のテスト。"""
+@pytest.fixture
+def no_env(monkeypatch: MonkeyPatch) -> Generator[None, None, None]:
+    """OPENAI_API_KEY が未設定の状態を再現します。
+
+    .env ファイルは読み込まず、os.getenv は常にデフォルト値を返します。
+
+    Args:
+        monkeypatch: pytest の monkeypatch フィクスチャ
+
+    Yields:
+        None
+    """
     # 環境変数をクリア
     monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    get_settings.cache_clear()
 
-    # dotenvのload_dotenvをモック化して.envファイルを読み込まないようにする
-    with patch('dotenv.load_dotenv'):
-        # os.getenvをモック化してOPENAI_API_KEYが存在しないようにする
-        with patch('os.getenv') as mock_getenv:
+    def getenv(key: str, default: str | None = None) -> str | None:
+        return default
 
-            def mock_getenv_side_effect(
-                key: str, default: str | None = None
-            ) -> str | None:
-                if key == 'OPENAI_API_KEY':
-                    return 'dummy-api-key'
-                return default
+    # .envファイルを読み込まず、環境変数が存在しないものとして扱う
+    with patch('dotenv.load_dotenv'), patch('os.getenv', side_effect=getenv):
+        yield
+    get_settings.cache_clear()
 
-            mock_getenv.side_effect = mock_getenv_side_effect
-            settings = get_settings()
-            assert settings.openai_api_key == 'dummy-api-key'
+
+def test_get_settings_with_missing_env_vars(no_env: None) -> None:
+    """環境変数が不足している場合のテスト。"""
+    assert get_settings().openai_api_key == 'dummy-api-key'
 
 
 def test_mock_settings_fixture(mock_settings: Settings) -> None:
@@ -74,3 +84,8 @@ def test_mock_settings_fixture(mock_settings: Settings) -> None:
     assert mock_settings.model_name == 'test-model'
     assert mock_settings.temperature == 0.0
     assert mock_settings.timezone == 'UTC'
+
+
+def test_get_settings_cached(mock_env_vars: None) -> None:
+    """設定インスタンスのキャッシュテスト。"""
+    assert get_settings() is get_settings()
@@ -0,0 +1,82 @@
+"""
+エージェントモジュールのテスト。
+
+このモジュールは、エージェントモジュールの機能をテストします。
+"""
+
+import os
+from collections.abc import Generator
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.core import agent as agent_module
+from src.human_like_ai.core.agent import AgentFactory
+
+
+@pytest.fixture
+def sheet_settings(
+    test_character_file: Path, mock_env_vars: None, mock_settings: Settings
+) -> Settings:
+    """一時ディレクトリのキャラクターシートを参照する設定を提供します。
+
+    Args:
+        test_character_file: テスト用のキャラクターファイルのパス
+        mock_env_vars: テスト用の環境変数
+        mock_settings: テスト用のモック設定
+
+    Returns:
+        Settings: テスト用の設定
+    """
+    return replace(mock_settings, character_sheet_path=test_character_file)
+
+
+@pytest.fixture
+def mock_rag_service_class() -> Generator[MagicMock, None, None]:
+    """キャラクターRAGサービスとロガーをモック化し、再利用キャッシュを空にします。
+
+    Yields:
+        MagicMock: CharacterRAGService クラスのモック
+    """
+    with (
+        patch.dict(agent_module._rag_service_cache, clear=True),
+        patch('src.human_like_ai.utils.logging.get_default_logger'),
+        patch('src.human_like_ai.core.rag.CharacterRAGService') as mock_class,
+    ):
+        yield mock_class
+
+
+def test_create_agent_reuses_rag_service(
+    sheet_settings: Settings, mock_rag_service_class: MagicMock
+) -> None:
+    """キャラクターシートが未更新の場合はRAGサービスを再利用することのテスト。"""
+    first = AgentFactory.create_agent(sheet_settings)
+    second = AgentFactory.create_agent(sheet_settings)
+
+    # 初期化は1回だけ行われ、同じサービスが共有される
+    assert mock_rag_service_class.call_count == 1
+    rag_service = mock_rag_service_class.return_value
+    assert rag_service.initialize_from_character_sheet.call_count == 1
+    assert first.rag_service is second.rag_service
+    assert first.emotion_extractor is second.emotion_extractor
+
+
+def test_create_agent_rebuilds_rag_service_on_sheet_update(
+    sheet_settings: Settings, mock_rag_service_class: MagicMock
+) -> None:
+    """キャラクターシートが更新された場合はRAGサービスを作り直すことのテスト。"""
+    AgentFactory.create_agent(sheet_settings)
+
+    # キャラクターシートの更新時刻を進める
+    sheet_path = Path(sheet_settings.character_sheet_path)
+    newer = sheet_path.stat().st_mtime + 10
+    os.utime(sheet_path, (newer, newer))
+
+    AgentFactory.create_agent(sheet_settings)
+
+    assert mock_rag_service_class.call_count == 2
+    rag_service = mock_rag_service_class.return_value
+    assert rag_service.initialize_from_character_sheet.call_count == 2
@@ -0,0 +1,100 @@
+"""
+記憶管理モジュールのテスト。
+
+このモジュールは、記憶管理モジュールの機能をテストします。
+"""
+
+import pytest
+
+from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.core.memory import MemoryManager
+
+
+@pytest.fixture
+def memory_manager(mock_settings: Settings) -> MemoryManager:
+    """テスト用の記憶マネージャーを提供します。
+
+    Args:
+        mock_settings: テスト用のモック設定
+
+    Returns:
+        MemoryManager: 記憶マネージャー
+    """
+    return MemoryManager(mock_settings, max_history_length=3)
+
+
+def test_add_memory_duplicate(memory_manager: MemoryManager) -> None:
+    """重複した長期記憶が追加されないことのテスト。"""
+    memory_manager.add_memory('カフェが好き')
+    text = memory_manager.get_memories_text()
+
+    memory_manager.add_memory('カフェが好き')
+    assert memory_manager.memories == ['カフェが好き']
+    # 変更がないためキャッシュは維持される
+    assert memory_manager.get_memories_text() is text
+
+
+def test_remove_then_add_memory(memory_manager: MemoryManager) -> None:
+    """削除した長期記憶を再度追加できることのテスト。"""
+    memory_manager.add_memory('A')
+    memory_manager.add_memory('B')
+    memory_manager.remove_memory('A')
+    assert memory_manager.get_memories_text() == 'B'
+
+    memory_manager.add_memory('A')
+    assert memory_manager.memories == ['B', 'A']
+    assert memory_manager.get_memories_text() == 'B\nA'
+
+
+def test_remove_missing_memory(memory_manager: MemoryManager) -> None:
+    """存在しない長期記憶の削除ではキャッシュが破棄されないことのテスト。"""
+    assert memory_manager.get_memories_text() == 'なし'
+    memory_manager.add_memory('A')
+    text = memory_manager.get_memories_text()
+
+    memory_manager.remove_memory('B')
+    assert memory_manager.memories == ['A']
+    assert memory_manager.get_memories_text() is text
+
+    # 実際に削除された場合はキャッシュが更新される
+    memory_manager.remove_memory('A')
+    assert memory_manager.get_memories_text() == 'なし'
+
+
+def test_attentions(memory_manager: MemoryManager) -> None:
+    """関心事の追加と削除のテスト。"""
+    memory_manager.add_attention('旅行')
+    memory_manager.add_attention('旅行')
+    text = memory_manager.get_attentions_text()
+    assert text == '旅行'
+
+    # 変更がない場合はキャッシュが維持される
+    memory_manager.remove_attention('映画')
+    assert memory_manager.get_attentions_text() is text
+
+    # 削除後に再度追加できる
+    memory_manager.remove_attention('旅行')
+    assert memory_manager.get_attentions_text() == 'なし'
+    memory_manager.add_attention('旅行')
+    assert memory_manager.attentions == ['旅行']
+
+
+def test_chat_history_max_length(memory_manager: MemoryManager) -> None:
+    """会話履歴が最大長を超えると古いメッセージから破棄されることのテスト。"""
+    for i in range(5):
+        memory_manager.add_user_message(f'メッセージ{i}')
+
+    history = memory_manager.get_chat_history()
+    assert [message.content for message in history] == [
+        'メッセージ2',
+        'メッセージ3',
+        'メッセージ4',
+    ]
+    assert isinstance(history, list)
+    assert memory_manager.max_history_length == 3
+
+
+def test_max_history_length_read_only(memory_manager: MemoryManager) -> None:
+    """会話履歴の最大長が変更できないことのテスト。"""
+    with pytest.raises(AttributeError):
+        memory_manager.max_history_length = 5
@@ -0,0 +1,256 @@
+"""
+RAGモジュールのテスト。
+
+このモジュールは、RAGモジュールの機能をテストします。
+"""
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_community.embeddings import FakeEmbeddings
+from langchain_core.documents import Document
+
+from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.core.rag import (
+    INDEX_CACHE_SUFFIX,
+    INDEX_HASH_FILENAME,
+    CharacterRAGService,
+    FAISSRAGService,
+)
+
+
+class _FakeEmbeddings(FakeEmbeddings):
+    """モデル名を持つテスト用の埋め込みモデル。
+
+    インデックスのハッシュには埋め込みモデル名が含まれるため、model 属性を追加します。
+    """
+
+    model: str = 'fake-embedding'
+
+
+@pytest.fixture
+def rag_service(mock_env_vars: None, mock_settings: Settings) -> CharacterRAGService:
+    """テスト用のキャラクターRAGサービスを提供します。
+
+    Args:
+        mock_env_vars: テスト用の環境変数
+        mock_settings: テスト用のモック設定
+
+    Returns:
+        CharacterRAGService: キャラクターRAGサービス
+    """
+    return CharacterRAGService(mock_settings)
+
+
+@pytest.fixture
+def mock_retrieve_docs(rag_service: CharacterRAGService) -> Generator[Mock, None, None]:
+    """検索処理をモック化し、クエリをそのまま内容とするドキュメントを返します。
+
+    Args:
+        rag_service: キャラクターRAGサービス
+
+    Yields:
+        Mock: _retrieve_docs のモック
+    """
+    with patch.object(
+        rag_service,
+        '_retrieve_docs',
+        side_effect=lambda query, k: [Document(page_content=query)],
+    ) as mock:
+        yield mock
+
+
+def test_retrieve_character_info_normalizes_query(
+    rag_service: CharacterRAGService, mock_retrieve_docs: Mock
+) -> None:
+    """前後の空白と大文字小文字を無視してキャッシュされることのテスト。"""
+    info = rag_service.retrieve_character_info(' Hobby ')
+    assert rag_service.retrieve_character_info('hobby') == info
+    assert rag_service.retrieve_character_info('HOBBY') == info
+    assert mock_retrieve_docs.call_count == 1
+
+    # 取得件数が異なる場合は別のキーとして扱う
+    rag_service.retrieve_character_info('hobby', k=5)
+    assert mock_retrieve_docs.call_count == 2
+
+
+def test_retrieve_character_info_evicts_least_recently_used(
+    rag_service: CharacterRAGService, mock_retrieve_docs: Mock
+) -> None:
+    """キャッシュが上限を超えた場合に最も古いクエリが破棄されることのテスト。"""
+    rag_service.RETRIEVE_CACHE_SIZE = 2
+
+    rag_service.retrieve_character_info('a')
+    rag_service.retrieve_character_info('b')
+    # 'a' を参照して最近使用したものにする
+    rag_service.retrieve_character_info('a')
+    assert mock_retrieve_docs.call_count == 2
+
+    # 上限を超えると最も長く使われていない 'b' が破棄される
+    rag_service.retrieve_character_info('c')
+    assert len(rag_service._retrieve_cache) == 2
+    rag_service.retrieve_character_info('a')
+    assert mock_retrieve_docs.call_count == 3
+    rag_service.retrieve_character_info('b')
+    assert mock_retrieve_docs.call_count == 4
+
+
+def test_retrieve_character_info_concurrent(
+    rag_service: CharacterRAGService, mock_retrieve_docs: Mock
+) -> None:
+    """複数スレッドから検索しても追い出しと競合しないことのテスト。"""
+    rag_service.RETRIEVE_CACHE_SIZE = 2
+    queries = [f'q{i % 5}' for i in range(500)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(rag_service.retrieve_character_info, queries))
+
+    assert results == queries
+    assert len(rag_service._retrieve_cache) <= 2
+
+
+def test_initialize_clears_retrieve_cache(
+    rag_service: CharacterRAGService, mock_retrieve_docs: Mock
+) -> None:
+    """再初期化すると検索結果キャッシュが破棄されることのテスト。"""
+    rag_service.retrieve_character_info('hobby')
+
+    with patch.object(FAISSRAGService, 'initialize'):
+        rag_service.initialize(['新しいドキュメント'])
+
+    assert not rag_service._retrieve_cache
+    rag_service.retrieve_character_info('hobby')
+    assert mock_retrieve_docs.call_count == 2
+
+
+@pytest.fixture
+def sheet_settings(
+    tmp_path: Path, mock_env_vars: None, mock_settings: Settings
+) -> Settings:
+    """一時ディレクトリのキャラクターシートを参照する設定を提供します。
+
+    Args:
+        tmp_path: 一時ディレクトリ
+        mock_env_vars: テスト用の環境変数
+        mock_settings: テスト用のモック設定
+
+    Returns:
+        Settings: テスト用の設定
+    """
+    sheet_path = tmp_path / 'character_sheet.yaml'
+    sheet_path.write_text(
+        'basic_info:\n  name: 北条 楓\n\npersonality:\n  traits: [明るい]\n',
+        encoding='utf-8',
+    )
+    return replace(mock_settings, character_sheet_path=sheet_path)
+
+
+def _make_service(settings: Settings) -> CharacterRAGService:
+    """テスト用の埋め込みモデルを使うキャラクターRAGサービスを作成します。
+
+    Args:
+        settings: テスト用の設定
+
+    Returns:
+        CharacterRAGService: キャラクターRAGサービス
+    """
+    service = CharacterRAGService(settings)
+    service.embeddings = _FakeEmbeddings(size=8)
+    return service
+
+
+def _cache_dir(settings: Settings) -> Path:
+    """キャラクターシートに対応するインデックスの保存先を取得します。
+
+    Args:
+        settings: テスト用の設定
+
+    Returns:
+        Path: インデックスの保存先ディレクトリ
+    """
+    sheet_path = Path(settings.character_sheet_path)
+    return sheet_path.with_name(sheet_path.name + INDEX_CACHE_SUFFIX)
+
+
+def test_initialize_from_character_sheet_saves_index(sheet_settings: Settings) -> None:
+    """初期化時にインデックスとハッシュが保存されることのテスト。"""
+    service = _make_service(sheet_settings)
+    service.initialize_from_character_sheet()
+
+    cache_dir = _cache_dir(sheet_settings)
+    assert service.vector_store is not None
+    assert (cache_dir / 'index.faiss').exists()
+    assert (cache_dir / 'index.pkl').exists()
+    assert (cache_dir / INDEX_HASH_FILENAME).read_text(encoding='utf-8')
+
+
+def test_initialize_from_character_sheet_loads_index(sheet_settings: Settings) -> None:
+    """ハッシュが一致する場合は埋め込みを再計算しないことのテスト。"""
+    _make_service(sheet_settings).initialize_from_character_sheet()
+
+    service = _make_service(sheet_settings)
+    with patch.object(service, 'initialize') as mock_initialize:
+        service.initialize_from_character_sheet()
+
+    assert not mock_initialize.called
+    assert service.vector_store is not None
+    assert service.retrieve_character_info('名前', k=1)
+
+
+def test_initialize_from_character_sheet_stale_hash(sheet_settings: Settings) -> None:
+    """ハッシュが一致しない場合はインデックスを作り直すことのテスト。"""
+    _make_service(sheet_settings).initialize_from_character_sheet()
+    hash_file = _cache_dir(sheet_settings) / INDEX_HASH_FILENAME
+    digest = hash_file.read_text(encoding='utf-8')
+    hash_file.write_text('stale', encoding='utf-8')
+
+    service = _make_service(sheet_settings)
+    with patch.object(
+        service, 'initialize', wraps=service.initialize
+    ) as mock_initialize:
+        service.initialize_from_character_sheet()
+
+    assert mock_initialize.call_count == 1
+    assert hash_file.read_text(encoding='utf-8') == digest
+
+
+def test_initialize_from_character_sheet_truncated_index(
+    sheet_settings: Settings,
+) -> None:
+    """保存済みのインデックスが壊れている場合はインデックスを作り直すことのテスト。"""
+    _make_service(sheet_settings).initialize_from_character_sheet()
+    (_cache_dir(sheet_settings) / 'index.pkl').write_bytes(b'')
+
+    service = _make_service(sheet_settings)
+    with patch.object(
+        service, 'initialize', wraps=service.initialize
+    ) as mock_initialize:
+        service.initialize_from_character_sheet()
+
+    assert mock_initialize.call_count == 1
+    assert service.vector_store is not None
+
+
+def test_initialize_from_character_sheet_save_failure(
+    sheet_settings: Settings,
+) -> None:
+    """インデックスの保存に失敗した場合は古いハッシュが残らないことのテスト。"""
+    _make_service(sheet_settings).initialize_from_character_sheet()
+    hash_file = _cache_dir(sheet_settings) / INDEX_HASH_FILENAME
+    assert hash_file.exists()
+
+    # ハッシュを不一致にして作り直させ、保存を失敗させる
+    hash_file.write_text('stale', encoding='utf-8')
+    service = _make_service(sheet_settings)
+    with patch(
+        'langchain_community.vectorstores.FAISS.save_local', side_effect=OSError
+    ):
+        service.initialize_from_character_sheet()
+
+    # 初期化自体は成功し、ハッシュは削除されている
+    assert service.vector_store is not None
+    assert not hash_file.exists()
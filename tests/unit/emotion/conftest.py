@@ -0,0 +1,60 @@
+"""
+感情パッケージのテストで共有するフィクスチャ。
+
+このモジュールは、感情マネージャーや感情抽出器のフィクスチャを提供します。
+"""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.human_like_ai.emotion.extractor import EmotionEventExtractor
+from src.human_like_ai.emotion.manager import EmotionManager
+from src.human_like_ai.emotion.models import BasicEmotion
+
+
+@pytest.fixture(scope='module')
+def _em_module() -> EmotionManager:
+    """モジュール内で共有する感情マネージャー。"""
+    return EmotionManager()
+
+
+@pytest.fixture
+def emotion_manager(_em_module: EmotionManager) -> EmotionManager:
+    """感情マネージャーのフィクスチャ。
+
+    共有インスタンスを初期状態に戻してから返します。
+    """
+    _em_module.emotions = []  # 索引・集計値・出力キャッシュも初期化される
+    _em_module.global_mood = dict.fromkeys(BasicEmotion, 0.0)
+    _em_module._dirty = False
+    return _em_module
+
+
+@pytest.fixture
+def mock_chain() -> Mock:
+    """モックチェーンのフィクスチャ。"""
+    return Mock(spec=['invoke'])
+
+
+@pytest.fixture
+def mock_chat_openai() -> Generator[MagicMock, None, None]:
+    """ChatOpenAIをモック化するフィクスチャ。"""
+    with patch('langchain_openai.ChatOpenAI') as mock_chat:
+        yield mock_chat
+
+
+@pytest.fixture
+def patched_extractor(mock_chat_openai: MagicMock) -> EmotionEventExtractor:
+    """ChatOpenAIをモック化した抽出器のフィクスチャ。"""
+    return EmotionEventExtractor('test-model')
+
+
+@pytest.fixture
+def mock_extractor(
+    patched_extractor: EmotionEventExtractor, mock_chain: Mock
+) -> EmotionEventExtractor:
+    """チェーンをモック化した抽出器のフィクスチャ。"""
+    patched_extractor.chain = mock_chain
+    return patched_extractor
@@ -5,6 +5,7 @@
 """
 
 from datetime import datetime, timedelta
+from math import isclose
 from unittest.mock import patch
 
 import pytest
@@ -16,11 +17,36 @@ from src.human_like_ai.emotion.models import (
     Emotion,
 )
 
-
-@pytest.fixture
-def emotion_manager() -> EmotionManager:
-    """感情マネージャーのフィクスチャ。"""
-    return EmotionManager()
+# 各テストで共通して使う固定の基準時刻
+_FROZEN = datetime(2024, 1, 1, tzinfo=DEFAULT_TIMEZONE)
+
+
+def _mk(
+    label: BasicEmotion,
+    intensity: float = 0.5,
+    target: str = 'A',
+    **kwargs: float,
+) -> Emotion:
+    """テスト用の感情イベントを作成します。
+
+    Args:
+        label: 基本感情のラベル
+        intensity: 感情の強度
+        target: 感情の対象
+        **kwargs: Emotion に渡すその他の引数
+
+    Returns:
+        Emotion: 感情イベント
+    """
+    kwargs.setdefault('last_updated_ts', _FROZEN.timestamp())
+    return Emotion(
+        label=label,
+        intensity=intensity,
+        target=target,
+        decay_rate=0.01,
+        amplification=1.0,
+        **kwargs,
+    )
 
 
 def test_emotion_manager_init(emotion_manager: EmotionManager) -> None:
@@ -34,14 +60,8 @@ def test_emotion_manager_init(emotion_manager: EmotionManager) -> None:
 def test_find_event(emotion_manager: EmotionManager) -> None:
     """イベント検索テスト。"""
     # テスト用の感情イベントを追加
-    emotion = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    emotion_manager.emotions.append(emotion)
+    emotion = _mk(BasicEmotion.JOY, 0.5, 'ユーザー')
+    emotion_manager.emotions = [emotion]
 
     # 存在するイベントの検索
     found = emotion_manager._find_event('ユーザー', BasicEmotion.JOY)
@@ -55,14 +75,8 @@ def test_find_event(emotion_manager: EmotionManager) -> None:
 def test_find_opposite_event(emotion_manager: EmotionManager) -> None:
     """反対感情イベント検索テスト。"""
     # テスト用の感情イベントを追加
-    emotion = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    emotion_manager.emotions.append(emotion)
+    emotion = _mk(BasicEmotion.JOY, 0.5, 'ユーザー')
+    emotion_manager.emotions = [emotion]
 
     # 反対感情イベントの検索
     opposite = emotion_manager._find_opposite_event('ユーザー', BasicEmotion.SADNESS)
@@ -76,20 +90,8 @@ def test_find_opposite_event(emotion_manager: EmotionManager) -> None:
 def test_derive_compound_emotion(emotion_manager: EmotionManager) -> None:
     """複合感情導出テスト。"""
     # テスト用の感情イベントを作成
-    joy = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    anticipation = Emotion(
-        label=BasicEmotion.ANTICIPATION,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
+    joy = _mk(BasicEmotion.JOY, 0.5, 'ユーザー')
+    anticipation = _mk(BasicEmotion.ANTICIPATION, 0.5, 'ユーザー')
 
     # 複合感情の導出
     compound = emotion_manager._derive_compound_emotion([joy, anticipation])
@@ -103,112 +105,67 @@ def test_derive_compound_emotion(emotion_manager: EmotionManager) -> None:
     # 複合感情が定義されていない組み合わせ
     undefined = emotion_manager._derive_compound_emotion(
         [
-            Emotion(
-                label=BasicEmotion.JOY,
-                intensity=0.5,
-                target='A',
-                decay_rate=0.01,
-                amplification=1.0,
-            ),
-            Emotion(
-                label=BasicEmotion.ANGER,
-                intensity=0.5,
-                target='A',
-                decay_rate=0.01,
-                amplification=1.0,
-            ),
-            Emotion(
-                label=BasicEmotion.FEAR,
-                intensity=0.5,
-                target='A',
-                decay_rate=0.01,
-                amplification=1.0,
-            ),
+            _mk(BasicEmotion.JOY, 0.5, 'A'),
+            _mk(BasicEmotion.ANGER, 0.5, 'A'),
+            _mk(BasicEmotion.FEAR, 0.5, 'A'),
         ]
     )
     assert undefined is None
 
 
-def test_update_emotion_new(emotion_manager: EmotionManager) -> None:
-    """新規感情更新テスト。"""
-    # 新しい感情の更新
-    emotion_manager.update_emotion(BasicEmotion.JOY, 'ユーザー', 'medium')
+@pytest.mark.parametrize(
+    ('seed_intensity', 'label', 'expected_label', 'expected_intensity'),
+    [
+        # 新規の感情が追加される(medium = 0.05)
+        pytest.param(None, BasicEmotion.JOY, BasicEmotion.JOY, 0.05, id='new'),
+        # 同じ感情は強度が加算される(0.5 + 0.05)
+        pytest.param(0.5, BasicEmotion.JOY, BasicEmotion.JOY, 0.55, id='existing'),
+        # 反対感情は既存の感情を減少させる(0.5 - 0.05)
+        pytest.param(0.5, BasicEmotion.SADNESS, BasicEmotion.JOY, 0.45, id='opposite'),
+        # 反対感情が上回ると既存の感情が削除され、差分が追加される(0.05 - 0.03)
+        pytest.param(
+            0.03,
+            BasicEmotion.SADNESS,
+            BasicEmotion.SADNESS,
+            0.02,
+            id='opposite_removal',
+        ),
+    ],
+)
+def test_update_emotion(
+    emotion_manager: EmotionManager,
+    seed_intensity: float | None,
+    label: BasicEmotion,
+    expected_label: BasicEmotion,
+    expected_intensity: float,
+) -> None:
+    """感情更新テスト。"""
+    # 既存の喜びの感情を追加
+    if seed_intensity is not None:
+        emotion_manager.emotions = [_mk(BasicEmotion.JOY, seed_intensity, 'ユーザー')]
 
-    # 感情が追加されたことを確認
+    # 感情の更新
+    emotion_manager.update_emotion(label, 'ユーザー', 'medium')
+
+    # 感情イベントが1件だけ残っていることを確認
     assert len(emotion_manager.emotions) == 1
     emotion = emotion_manager.emotions[0]
-    assert emotion.label == BasicEmotion.JOY
+    assert emotion.label == expected_label
     assert emotion.target == 'ユーザー'
-    assert emotion.intensity == 0.05  # medium = 0.05
+    assert isclose(emotion.intensity, expected_intensity, abs_tol=1e-10)
     assert emotion_manager._dirty is True
 
+    # 索引も更新されていることを確認
+    assert emotion_manager._find_event('ユーザー', expected_label) is emotion
 
-def test_update_emotion_existing(emotion_manager: EmotionManager) -> None:
-    """既存感情更新テスト。"""
-    # 既存の感情を追加
-    emotion = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    emotion_manager.emotions.append(emotion)
-
-    # 同じ感情の更新
-    emotion_manager.update_emotion(BasicEmotion.JOY, 'ユーザー', 'medium')
-
-    # 感情が更新されたことを確認
-    assert len(emotion_manager.emotions) == 1
-    updated = emotion_manager.emotions[0]
-    assert updated.intensity == 0.55  # 0.5 + 0.05
-    assert emotion_manager._dirty is True
 
+def test_update_emotion_unknown_strength(emotion_manager: EmotionManager) -> None:
+    """未知の強さによる感情更新テスト。"""
+    emotion_manager.update_emotion(BasicEmotion.JOY, 'ユーザー', 'extreme')
 
-def test_update_emotion_opposite(emotion_manager: EmotionManager) -> None:
-    """反対感情更新テスト。"""
-    # 既存の感情を追加
-    emotion = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.5,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    emotion_manager.emotions.append(emotion)
-
-    # 反対感情の更新
-    emotion_manager.update_emotion(BasicEmotion.SADNESS, 'ユーザー', 'medium')
-
-    # 既存の感情が減少したことを確認
-    assert len(emotion_manager.emotions) == 1
-    updated = emotion_manager.emotions[0]
-    assert updated.label == BasicEmotion.JOY
-    assert updated.intensity == 0.45  # 0.5 - 0.05
-    assert emotion_manager._dirty is True
-
-
-def test_update_emotion_opposite_removal(emotion_manager: EmotionManager) -> None:
-    """反対感情による削除テスト。"""
-    # 既存の感情を追加(弱い感情)
-    emotion = Emotion(
-        label=BasicEmotion.JOY,
-        intensity=0.03,
-        target='ユーザー',
-        decay_rate=0.01,
-        amplification=1.0,
-    )
-    emotion_manager.emotions.append(emotion)
-
-    # 反対感情の更新(強い感情)
-    emotion_manager.update_emotion(BasicEmotion.SADNESS, 'ユーザー', 'medium')
-
-    # 既存の感情が削除され、反対感情が追加されたことを確認
-    assert len(emotion_manager.emotions) == 1
-    new_emotion = emotion_manager.emotions[0]
-    assert new_emotion.label == BasicEmotion.SADNESS
-    assert new_emotion.intensity == pytest.approx(0.02, abs=1e-10)  # 0.05 - 0.03
-    assert emotion_manager._dirty is True
+    # 状態が変更されないことを確認
+    assert emotion_manager.emotions == []
+    assert emotion_manager._dirty is False
 
 
 def test_update_from_llm(emotion_manager: EmotionManager) -> None:
@@ -218,6 +175,8 @@ def test_update_from_llm(emotion_manager: EmotionManager) -> None:
         {'target': 'ユーザー', 'label': 'joy', 'strength': 'medium'},
         {'target': '話題', 'label': 'interest', 'strength': 'strong'},  # 無効な感情
         {'target': '自分自身', 'label': 'fear', 'strength': 'weak'},
+        {'target': ' ', 'label': 'anger', 'strength': 'strong'},  # 対象が空
+        {'target': 'ユーザー', 'strength': 'strong'},  # ラベルなし
     ]
 
     # 感情の更新
@@ -228,33 +187,17 @@ def test_update_from_llm(emotion_manager: EmotionManager) -> None:
     labels = [e.label for e in emotion_manager.emotions]
     assert BasicEmotion.JOY in labels
     assert BasicEmotion.FEAR in labels
+    # 同一バッチのイベントは同じ時刻で更新される
+    assert len({e.last_updated_ts for e in emotion_manager.emotions}) == 1
 
 
 def test_update_global_mood(emotion_manager: EmotionManager) -> None:
     """全体的な感情状態の更新テスト。"""
     # テスト用の感情イベントを追加
     emotion_manager.emotions = [
-        Emotion(
-            label=BasicEmotion.JOY,
-            intensity=0.5,
-            target='A',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.JOY,
-            intensity=0.7,
-            target='B',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.ANGER,
-            intensity=0.3,
-            target='C',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
+        _mk(BasicEmotion.JOY, 0.5, 'A'),
+        _mk(BasicEmotion.JOY, 0.7, 'B'),
+        _mk(BasicEmotion.ANGER, 0.3, 'C'),
     ]
 
     # 全体的な感情状態の更新
@@ -265,41 +208,47 @@ def test_update_global_mood(emotion_manager: EmotionManager) -> None:
     assert emotion_manager.global_mood[BasicEmotion.ANGER] == 0.3
 
 
+def test_update_global_mood_incremental(emotion_manager: EmotionManager) -> None:
+    """差分更新した集計値が全件の再計算と一致するかのテスト。"""
+    emotion_manager.update_from_llm(
+        [
+            {'target': 'A', 'label': 'joy', 'strength': 'strong'},
+            {'target': 'B', 'label': 'joy', 'strength': 'weak'},
+            {'target': 'A', 'label': 'sadness', 'strength': 'weak'},
+            {'target': 'B', 'label': 'sadness', 'strength': 'strong'},
+        ]
+    )
+
+    # 全件から再計算した平均と比較
+    for be in BasicEmotion:
+        intensities = [e.intensity for e in emotion_manager.emotions if e.label is be]
+        expected = sum(intensities) / len(intensities) if intensities else 0.0
+        assert isclose(emotion_manager.global_mood[be], expected, abs_tol=1e-10)
+
+
 def test_apply_decay(emotion_manager: EmotionManager) -> None:
     """感情の減衰テスト。"""
-    # 現在時刻の取得
-    now = datetime.now(DEFAULT_TIMEZONE)
+    # 固定の基準時刻を現在時刻とする
+    now = _FROZEN
     past = now - timedelta(minutes=10)
 
     # テスト用の感情イベントを追加
     emotion_manager.emotions = [
-        Emotion(
-            label=BasicEmotion.JOY,
-            intensity=0.5,
-            target='A',
-            last_updated=past,
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.ANGER,
-            intensity=0.05,
-            target='B',
-            last_updated=past,
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
+        _mk(BasicEmotion.JOY, 0.5, 'A', last_updated_ts=past.timestamp()),
+        _mk(BasicEmotion.ANGER, 0.05, 'B', last_updated_ts=past.timestamp()),
     ]
 
     # 感情の減衰を適用
-    with patch('src.human_like_ai.emotion.manager.datetime') as mock_datetime:
-        mock_datetime.now.return_value = now
+    with patch('src.human_like_ai.emotion.manager.time') as mock_time:
+        mock_time.time.return_value = now.timestamp()
         emotion_manager.apply_decay(unit_seconds=60)
 
     # 減衰後の感情を確認
     assert len(emotion_manager.emotions) == 1  # 弱い怒りは削除される
     assert emotion_manager.emotions[0].label == BasicEmotion.JOY
     assert emotion_manager.emotions[0].intensity < 0.5  # 減衰している
+    # 0.01 x 10分
+    assert isclose(emotion_manager.emotions[0].intensity, 0.4, abs_tol=1e-10)
     # _commit_updates()が呼ばれるため、_dirtyはFalseになる
     assert emotion_manager._dirty is False
 
@@ -308,39 +257,26 @@ def test_generate_output(emotion_manager: EmotionManager) -> None:
     """出力生成テスト。"""
     # テスト用の感情イベントを追加
     emotion_manager.emotions = [
-        Emotion(
-            label=BasicEmotion.JOY,
-            intensity=0.5,
-            target='ユーザー',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.ANTICIPATION,
-            intensity=0.5,
-            target='ユーザー',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.ANGER,
-            intensity=0.8,
-            target='話題',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
+        _mk(BasicEmotion.JOY, 0.5, 'ユーザー'),
+        _mk(BasicEmotion.ANTICIPATION, 0.5, 'ユーザー'),
+        _mk(BasicEmotion.ANGER, 0.8, '話題'),
     ]
 
-    # 全体的な感情状態を設定
-    emotion_manager.global_mood = {
+    # 全体的な感情状態を設定(未更新扱いにして再計算を省かせる)
+    mood = {
         BasicEmotion.JOY: 0.5,
         BasicEmotion.ANTICIPATION: 0.5,
         BasicEmotion.ANGER: 0.8,
     }
+    emotion_manager.global_mood = mood
+    emotion_manager._dirty = False
 
     # 出力の生成
     output = emotion_manager.generate_output()
 
+    # dirty でなければ global_mood は再計算されない
+    assert emotion_manager.global_mood is mood
+
     # 出力の確認
     assert '基本感情' in output
     assert '喜び' in output
@@ -351,24 +287,27 @@ def test_generate_output(emotion_manager: EmotionManager) -> None:
     assert '楽観' in output  # 複合感情
 
 
+def test_generate_output_cached(emotion_manager: EmotionManager) -> None:
+    """出力生成のキャッシュテスト。"""
+    emotion_manager.update_emotion(BasicEmotion.JOY, 'ユーザー', 'strong')
+
+    # 状態が変わらなければ同じ文字列を返す
+    output = emotion_manager.generate_output()
+    assert emotion_manager.generate_output() is output
+
+    # 状態が変われば出力も更新される
+    emotion_manager.update_emotion(BasicEmotion.ANGER, '話題', 'strong')
+    updated = emotion_manager.generate_output()
+    assert updated != output
+    assert '[話題]' in updated
+
+
 def test_get_emotions(emotion_manager: EmotionManager) -> None:
     """感情イベントリスト取得テスト。"""
     # テスト用の感情イベントを追加
     emotions = [
-        Emotion(
-            label=BasicEmotion.JOY,
-            intensity=0.5,
-            target='A',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
-        Emotion(
-            label=BasicEmotion.ANGER,
-            intensity=0.3,
-            target='B',
-            decay_rate=0.01,
-            amplification=1.0,
-        ),
+        _mk(BasicEmotion.JOY, 0.5, 'A'),
+        _mk(BasicEmotion.ANGER, 0.3, 'B'),
     ]
     emotion_manager.emotions = emotions
 
@@ -20,46 +20,52 @@ from src.human_like_ai.emotion.models import (
     get_intensity_category,
 )
 
-
-def test_basic_emotion_enum() -> None:
-    """基本感情の列挙型テスト。"""
-    # 列挙型の値の確認
-    assert BasicEmotion.JOY.value == 'joy'
-    assert BasicEmotion.ANGER.value == 'anger'
-    assert BasicEmotion.FEAR.value == 'fear'
-    assert BasicEmotion.SADNESS.value == 'sadness'
-    assert BasicEmotion.DISGUST.value == 'disgust'
-    assert BasicEmotion.SURPRISE.value == 'surprise'
-    assert BasicEmotion.ANTICIPATION.value == 'anticipation'
-    assert BasicEmotion.TRUST.value == 'trust'
-
-    # 日本語名の確認
-    assert BasicEmotion.JOY.japanese == '喜び'
-    assert BasicEmotion.ANGER.japanese == '怒り'
-    assert BasicEmotion.FEAR.japanese == '恐れ'
-    assert BasicEmotion.SADNESS.japanese == '悲しみ'
-    assert BasicEmotion.DISGUST.japanese == '嫌悪'
-    assert BasicEmotion.SURPRISE.japanese == '驚き'
-    assert BasicEmotion.ANTICIPATION.japanese == '期待'
-    assert BasicEmotion.TRUST.japanese == '信頼'
-
-
-def test_event_strength_mapping() -> None:
-    """イベント強度マッピングのテスト。"""
-    assert EVENT_STRENGTH_MAPPING['weak'] == 0.03
-    assert EVENT_STRENGTH_MAPPING['medium'] == 0.05
-    assert EVENT_STRENGTH_MAPPING['strong'] == 0.10
+# 現在時刻に依存しないテストで使う固定の基準時刻
+_FROZEN = datetime(2024, 1, 1, tzinfo=DEFAULT_TIMEZONE)
+
+
+@pytest.mark.parametrize(
+    ('emotion', 'value', 'japanese'),
+    [
+        (BasicEmotion.JOY, 'joy', '喜び'),
+        (BasicEmotion.ANGER, 'anger', '怒り'),
+        (BasicEmotion.FEAR, 'fear', '恐れ'),
+        (BasicEmotion.SADNESS, 'sadness', '悲しみ'),
+        (BasicEmotion.DISGUST, 'disgust', '嫌悪'),
+        (BasicEmotion.SURPRISE, 'surprise', '驚き'),
+        (BasicEmotion.ANTICIPATION, 'anticipation', '期待'),
+        (BasicEmotion.TRUST, 'trust', '信頼'),
+    ],
+)
+def test_basic_emotion_enum(emotion: BasicEmotion, value: str, japanese: str) -> None:
+    """基本感情の列挙型テスト(値と日本語名)。"""
+    assert emotion.value == value
+    assert emotion.japanese == japanese
 
 
-def test_alternate_names() -> None:
+@pytest.mark.parametrize(
+    ('strength', 'intensity'),
+    [('weak', 0.03), ('medium', 0.05), ('strong', 0.10)],
+)
+def test_event_strength_mapping(strength: str, intensity: float) -> None:
+    """イベント強度マッピングのテスト。"""
+    assert EVENT_STRENGTH_MAPPING[strength] == intensity
+
+
+@pytest.mark.parametrize(
+    ('emotion', 'category', 'japanese'),
+    [
+        # 喜びの別名
+        (BasicEmotion.JOY, 'weak', 'ほのかな喜び'),
+        (BasicEmotion.JOY, 'strong', '恍惚'),
+        # 怒りの別名
+        (BasicEmotion.ANGER, 'weak', '苛立ち'),
+        (BasicEmotion.ANGER, 'strong', '激怒'),
+    ],
+)
+def test_alternate_names(emotion: BasicEmotion, category: str, japanese: str) -> None:
     """感情の別名テスト。"""
-    # 喜びの別名
-    assert ALTERNATE_NAMES[BasicEmotion.JOY]['weak']['jp'] == 'ほのかな喜び'
-    assert ALTERNATE_NAMES[BasicEmotion.JOY]['strong']['jp'] == '恍惚'
-
-    # 怒りの別名
-    assert ALTERNATE_NAMES[BasicEmotion.ANGER]['weak']['jp'] == '苛立ち'
-    assert ALTERNATE_NAMES[BasicEmotion.ANGER]['strong']['jp'] == '激怒'
+    assert ALTERNATE_NAMES[emotion][category]['jp'] == japanese
 
 
 def test_compound_emotions() -> None:
@@ -73,16 +79,22 @@ def test_compound_emotions() -> None:
     assert COMPOUND_EMOTIONS[compound_key]['jp'] == '軽蔑'
 
 
-def test_opposite_emotions() -> None:
+@pytest.mark.parametrize(
+    ('emotion', 'opposite'),
+    [
+        (BasicEmotion.JOY, BasicEmotion.SADNESS),
+        (BasicEmotion.SADNESS, BasicEmotion.JOY),
+        (BasicEmotion.ANGER, BasicEmotion.FEAR),
+        (BasicEmotion.FEAR, BasicEmotion.ANGER),
+        (BasicEmotion.TRUST, BasicEmotion.DISGUST),
+        (BasicEmotion.DISGUST, BasicEmotion.TRUST),
+        (BasicEmotion.ANTICIPATION, BasicEmotion.SURPRISE),
+        (BasicEmotion.SURPRISE, BasicEmotion.ANTICIPATION),
+    ],
+)
+def test_opposite_emotions(emotion: BasicEmotion, opposite: BasicEmotion) -> None:
     """反対感情テスト。"""
-    assert OPPOSITE_EMOTIONS[BasicEmotion.JOY] == BasicEmotion.SADNESS
-    assert OPPOSITE_EMOTIONS[BasicEmotion.SADNESS] == BasicEmotion.JOY
-    assert OPPOSITE_EMOTIONS[BasicEmotion.ANGER] == BasicEmotion.FEAR
-    assert OPPOSITE_EMOTIONS[BasicEmotion.FEAR] == BasicEmotion.ANGER
-    assert OPPOSITE_EMOTIONS[BasicEmotion.TRUST] == BasicEmotion.DISGUST
-    assert OPPOSITE_EMOTIONS[BasicEmotion.DISGUST] == BasicEmotion.TRUST
-    assert OPPOSITE_EMOTIONS[BasicEmotion.ANTICIPATION] == BasicEmotion.SURPRISE
-    assert OPPOSITE_EMOTIONS[BasicEmotion.SURPRISE] == BasicEmotion.ANTICIPATION
+    assert OPPOSITE_EMOTIONS[emotion] == opposite
 
 
 def test_intensity_thresholds() -> None:
@@ -213,15 +225,19 @@ def test_emotion_model_last_updated() -> None:
     assert time_diff < 1.0  # 1秒以内の差
 
     # 最終更新時刻を明示的に設定
-    past_time = now - timedelta(hours=1)
+    past_time = _FROZEN - timedelta(hours=1)
     emotion = Emotion(
         label=BasicEmotion.JOY,
         intensity=0.0,
         target='ユーザー',
         decay_rate=0.01,
         amplification=1.0,
-        last_updated=past_time,
+        last_updated_ts=past_time.timestamp(),
     )
 
     # 設定した時刻が反映されていることを確認
     assert emotion.last_updated == past_time
+
+    # datetime での代入はエポック秒に変換される
+    emotion.last_updated = now
+    assert emotion.last_updated_ts == now.timestamp()
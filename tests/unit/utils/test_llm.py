@@ -0,0 +1,88 @@
+"""
+LLMユーティリティモジュールのテスト。
+
+このモジュールは、LLMユーティリティモジュールの機能をテストします。
+"""
+
+import asyncio
+from collections.abc import Generator, Sequence
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.utils.llm import LLMService
+
+# テスト用のプロンプトコンテキスト
+_CONTEXTS = [
+    {'messages': [HumanMessage(content='first')]},
+    {'messages': [HumanMessage(content='second')]},
+]
+
+
+def _echo(inputs: Sequence[list[BaseMessage]]) -> list[AIMessage]:
+    """各入力の本文を大文字にした応答を返します。
+
+    Args:
+        inputs: メッセージリストのリスト
+
+    Returns:
+        List[AIMessage]: 入力と同じ順序の応答
+    """
+    return [AIMessage(content=str(messages[0].content).upper()) for messages in inputs]
+
+
+@pytest.fixture
+def mock_model() -> Generator[Mock, None, None]:
+    """チャットモデルをモック化します。
+
+    Yields:
+        Mock: チャットモデルのモック
+    """
+    model = Mock(spec=['invoke', 'batch', 'abatch'])
+    model.batch.side_effect = _echo
+    model.abatch = AsyncMock(side_effect=_echo)
+    with patch('src.human_like_ai.utils.llm._get_chat_model', return_value=model):
+        yield model
+
+
+def test_generate_batch(mock_model: Mock, mock_settings: Settings) -> None:
+    """複数のコンテキストからの一括生成テスト。"""
+    service = LLMService(mock_settings)
+
+    responses = service.generate_batch(_CONTEXTS)
+
+    # 応答の本文が入力と同じ順序で返される
+    assert responses == ['FIRST', 'SECOND']
+    mock_model.batch.assert_called_once_with(
+        [context['messages'] for context in _CONTEXTS]
+    )
+
+
+def test_agenerate_batch(mock_model: Mock, mock_settings: Settings) -> None:
+    """複数のコンテキストからの非同期一括生成テスト。"""
+    service = LLMService(mock_settings)
+
+    responses = asyncio.run(service.agenerate_batch(_CONTEXTS))
+
+    # 応答の本文が入力と同じ順序で返される
+    assert responses == ['FIRST', 'SECOND']
+    mock_model.abatch.assert_awaited_once_with(
+        [context['messages'] for context in _CONTEXTS]
+    )
+
+
+def test_generate_batch_reuses_prompt_template_contexts(
+    mock_model: Mock, mock_settings: Settings
+) -> None:
+    """プロンプトテンプレートを含むコンテキストを再利用できることのテスト。"""
+    service = LLMService(mock_settings)
+    prompt_template = ChatPromptTemplate.from_messages([('human', '{text}')])
+    context = {'prompt_template': prompt_template, 'text': 'again'}
+
+    # 同じコンテキストを複数回渡しても変更されない
+    assert service.generate_batch([context, context]) == ['AGAIN', 'AGAIN']
+    assert service.generate_batch([context]) == ['AGAIN']
+    assert context == {'prompt_template': prompt_template, 'text': 'again'}
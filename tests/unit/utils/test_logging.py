@@ -0,0 +1,82 @@
+"""
+ロギングユーティリティモジュールのテスト。
+
+このモジュールは、ロギングユーティリティモジュールの機能をテストします。
+"""
+
+import logging
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from src.human_like_ai.config.settings import Settings
+from src.human_like_ai.utils.logging import get_default_logger, setup_logger
+
+
+@pytest.fixture
+def log_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Path, None, None]:
+    """一時ディレクトリをカレントディレクトリにし、終了時にハンドラを片付けます。
+
+    Args:
+        tmp_path: 一時ディレクトリ
+        monkeypatch: pytest の monkeypatch フィクスチャ
+
+    Yields:
+        Path: ログディレクトリ
+    """
+    monkeypatch.chdir(tmp_path)
+
+    yield tmp_path / 'logs'
+
+    logger = logging.getLogger('human_like_ai')
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def _file_names(logger: logging.Logger) -> list[str]:
+    """ロガーに設定されたファイルハンドラの出力先を取得します。
+
+    Args:
+        logger: ロガー
+
+    Returns:
+        List[str]: ファイルハンドラの出力先のリスト
+    """
+    return [
+        h.baseFilename for h in logger.handlers if isinstance(h, logging.FileHandler)
+    ]
+
+
+def test_get_default_logger_no_duplicate_handlers(
+    log_cwd: Path, mock_settings: Settings
+) -> None:
+    """2回呼び出してもハンドラが重複しないことのテスト。"""
+    logger = get_default_logger(mock_settings)
+    handlers = list(logger.handlers)
+
+    assert get_default_logger(mock_settings) is logger
+    assert logger.handlers == handlers
+    assert len(logger.handlers) == 2
+    assert len(_file_names(logger)) == 1
+    assert Path(_file_names(logger)[0]).parent == log_cwd
+
+
+def test_get_default_logger_restores_handlers(
+    log_cwd: Path, mock_settings: Settings
+) -> None:
+    """別の出力先で再設定された場合にファイル出力が元に戻ることのテスト。"""
+    logger = get_default_logger(mock_settings)
+    file_names = _file_names(logger)
+
+    # ファイル出力なしで再設定する
+    setup_logger('human_like_ai', log_file=None, settings=mock_settings)
+    assert _file_names(logger) == []
+
+    # 再取得するとファイルハンドラが再設定される
+    assert get_default_logger(mock_settings) is logger
+    assert _file_names(logger) == file_names
+    assert len(logger.handlers) == 2